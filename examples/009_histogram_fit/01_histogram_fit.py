@@ -14,16 +14,29 @@ of entries N of the histogram.
 """
 
 import numpy as np
+from scipy.special import ndtr
+
 import kafe2
 
+SQRT_2PI = np.sqrt(2.0 * np.pi)
+
 
 def normal_distribution(x, mu=0.01, sigma=1.0):
-    return np.exp(-0.5 * ((x - mu) / sigma) ** 2) / np.sqrt(2.0 * np.pi * sigma ** 2)
+    z = (x - mu) / sigma
+    return np.exp(-0.5 * z * z) / (abs(sigma) * SQRT_2PI)
+
+
+# The antiderivative of the model function is known in closed form.
+# If it is passed to the fit the bin heights are calculated exactly from the bin edges instead of
+# approximating the integral over each bin through multiple evaluations of the density:
+def normal_distribution_cdf(x, mu=0.01, sigma=1.0):
+    return ndtr((x - mu) / abs(sigma))
 
 
 # random dataset of 100 random values, following a normal distribution with mu=0 and sigma=1
-data = np.random.normal(loc=0, scale=1, size=100)
+rng = np.random.default_rng()
+data = rng.normal(loc=0, scale=1, size=100)
 
 # Finally, do the fit and plot it:
-kafe2.hist_fit(model_function=normal_distribution, data=data, n_bins=10, bin_range=(-5, 5))
+kafe2.hist_fit(model_function=normal_distribution, data=data, n_bins=10, bin_range=(-5, 5), bin_evaluation=normal_distribution_cdf)
 kafe2.plot()
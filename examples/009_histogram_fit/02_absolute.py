@@ -13,12 +13,18 @@ import numpy as np
 import kafe2
 
 
+SQRT_2PI = np.sqrt(2.0 * np.pi)
+
+
 def normal_distribution(x, A=100, mu=0.01, sigma=1.0):
-    return A * np.exp(-0.5 * ((x - mu) / sigma) ** 2) / np.sqrt(2.0 * np.pi * sigma ** 2)
+    z = (x - mu) / sigma
+    # fold the amplitude into the scalar prefactor to avoid an extra pass over the array
+    return np.exp(-0.5 * z * z) * (A / (abs(sigma) * SQRT_2PI))
 
 
 # random dataset of 100 random values, following a normal distribution with mu=0 and sigma=1
-data = np.random.normal(loc=0, scale=1, size=100)
+rng = np.random.default_rng()
+data = rng.normal(loc=0, scale=1, size=100)
 
 # Finally, do the fit and plot it:
 kafe2.hist_fit(model_function=normal_distribution, data=data, n_bins=10, bin_range=(-5, 5), density=False)
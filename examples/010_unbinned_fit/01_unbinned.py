@@ -34,9 +34,13 @@ def pdf(t, tau=2.2, fbg=0.1, a=1.0, b=9.75):
     :param b: the maximum decay time which can be measured
     :return: probability for decay time x
     """
-    pdf1 = np.exp(-t / tau) / tau / (np.exp(-a / tau) - np.exp(-b / tau))
-    pdf2 = 1. / (b - a)
-    return (1 - fbg) * pdf1 + fbg * pdf2
+    # The normalization only depends on the parameters, so compute it once as a scalar
+    # instead of broadcasting it over the whole array of decay times.
+    # exp(-a/tau) - exp(-b/tau) is written with expm1 to avoid cancellation for small (b-a)/tau.
+    inv_tau = 1.0 / tau
+    norm_signal = (1 - fbg) * inv_tau / (np.exp(-a * inv_tau) * -np.expm1((a - b) * inv_tau))
+    norm_background = fbg / (b - a)
+    return norm_signal * np.exp(t * -inv_tau) + norm_background
 
 
 # load the data from the experiment
@@ -76,7 +76,8 @@ from kafe2 import XYFit, Plot
 # empirical model for T(U): a parabola
 def empirical_T_U_model(U, p_2=1.0, p_1=1.0, p_0=1.0):
     # use quadratic model as empirical temperature dependence T(U)
-    return p_2 * U**2 + p_1 * U + p_0
+    # (evaluated in Horner form, which needs no U**2 temporary)
+    return (p_2 * U + p_1) * U + p_0
 
 
 # model of current-voltage dependence I(U) for a heating resistor
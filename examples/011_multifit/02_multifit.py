@@ -70,14 +70,14 @@ from kafe2 import XYFit, MultiFit, Plot
 # empirical model for T(U): a parabola
 def empirical_T_U_model(U, p_2=1.0, p_1=1.0, p_0=1.0):
     # use quadratic model as empirical temperature dependence T(U)
-    return p_2 * U**2 + p_1 * U + p_0
+    # Horner form: no U**2 temporary, U is not constant because of the x errors
+    return (p_2 * U + p_1) * U + p_0
 
 # model of current-voltage dependence I(U) for a heating resistor
 def I_U_model(U, R_0=1., alpha=0.004, p_2=1.0, p_1=1.0, p_0=1.0):
-    # use quadratic model as empirical temperature dependence T(U)
-    _temperature = empirical_T_U_model(U, p_2, p_1, p_0)
-    # plug the temperature into the model
-    return U / (R_0 * (1.0 + _temperature * alpha))
+    # reuse the empirical temperature dependence T(U) so that both models share
+    # a single implementation of the quadratic, then plug it into the model
+    return U / (R_0 * (1.0 + alpha * empirical_T_U_model(U, p_2, p_1, p_0)))
 
 
 # -- Next, read the data from an external file
@@ -92,10 +92,13 @@ T -= T0  # Measurements are in Kelvin, convert to °C
 # -- Finally, go through the fitting procedure
 
 # Step 1: construct the singular fit objects
+# The model functions defined above are passed directly so kafe2 does not have to parse them
+# from a string with SymPy. The LaTeX expressions for the plots are assigned separately.
 fit_1 = XYFit(
     xy_data=[U, T],
-    model_function="empirical_T_U_model: U p_2=1.0 p_1=1.0 p_0=1.0 -> p_2 * U^2 + p_1 * U + p_0"
+    model_function=empirical_T_U_model
 )
+fit_1.assign_model_function_latex_expression(r'{p_2}\,{U}^2 + {p_1}\,{U} + {p_0}')
 fit_1.add_error(axis='y', err_val=sigT)  # declare errors on T
 fit_1.data_container.axis_labels = ("Voltage (V)", "Temperature (°C)")
 fit_1.data_container.label = "Temperature data"
@@ -103,7 +106,10 @@ fit_1.model_label = "Parametrization"
 
 fit_2 = XYFit(
     xy_data=[U, I],
-    model_function="I_U_model: U R_0 alpha=4e-3 p_2 p_1 p_0 -> U / (R_0 * (1 + alpha * (p_2 * U^2 + p_1 * U + p_0)))"
+    model_function=I_U_model
+)
+fit_2.assign_model_function_latex_expression(
+    r'\frac{{{U}}}{{{R_0} \left(1 + {alpha} \left({p_2}\,{U}^2 + {p_1}\,{U} + {p_0}\right)\right)}}'
 )
 fit_2.add_error(axis='y', err_val=sigI)  # declare errors on I
 fit_2.data_container.axis_labels = ("Voltage (V)", "Current (A)")
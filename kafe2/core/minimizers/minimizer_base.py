@@ -1,8 +1,8 @@
+import math
 from abc import ABCMeta, abstractmethod
 from copy import copy
 from typing import Sequence, Union
 
-import numdifftools as nd
 import numpy as np
 import six
 from scipy.optimize import root_scalar
@@ -122,7 +122,7 @@ class MinimizerBase(object):
         :rtype: float
         """
         _fval = self._func_handle(*args)
-        if not self._printed_inf_cost_warning and np.isinf(_fval):
+        if not self._printed_inf_cost_warning and math.isinf(_fval):
             print("Warning: the cost function has been evaluated as infinite. " "The fit might not converge correctly.")
             self._printed_inf_cost_warning = True
         return _fval
@@ -412,6 +412,50 @@ class MinimizerBase(object):
 
         return _arrow_specs
 
+    def _compute_hessian(self, x, h=None):
+        """
+        Calculate the Hessian matrix of the cost function with central finite differences.
+        Only free parameters are varied, rows and columns of fixed parameters are zero.
+        :param x: the parameter values at which to calculate the Hessian matrix.
+        :type x: iterable of float
+        :param h: step sizes for the parameters. By default the step size scales with the magnitude
+            of the parameter values.
+        :type h: iterable of float or None
+        :return: the Hessian matrix.
+        :rtype: numpy.ndarray of shape (num_pars, num_pars)
+        """
+        _x = np.array(x, dtype=float)
+        if h is None:
+            h = np.finfo(float).eps ** 0.25 * np.maximum(np.abs(_x), 1.0)
+        _h = np.broadcast_to(np.asarray(h, dtype=float), _x.shape)
+        _ids = [_i for _i, _par_name_i in enumerate(self._par_names) if not self.is_fixed(_par_name_i)]
+        _ids_i, _ids_j = np.triu_indices(len(_ids), k=1)
+        _ids_i = np.asarray(_ids, dtype=int)[_ids_i]
+        _ids_j = np.asarray(_ids, dtype=int)[_ids_j]
+
+        # Stencil points: x + h_i e_i, x - h_i e_i for the diagonal and x +- h_i e_i +- h_j e_j for
+        # the upper triangle, built in one pass.
+        _steps = np.diag(_h)
+        _diag_points = np.concatenate([_x + _steps[_ids], _x - _steps[_ids]])
+        _off_diag_points = np.concatenate(
+            [
+                _x + _steps[_ids_i] + _steps[_ids_j],
+                _x + _steps[_ids_i] - _steps[_ids_j],
+                _x - _steps[_ids_i] + _steps[_ids_j],
+                _x - _steps[_ids_i] - _steps[_ids_j],
+            ]
+        )
+        _f_0 = self._func_wrapper_unpack_args(_x)
+        _f_diag = np.array([self._func_wrapper_unpack_args(_p) for _p in _diag_points]).reshape(2, -1)
+        _f_off_diag = np.array([self._func_wrapper_unpack_args(_p) for _p in _off_diag_points]).reshape(4, -1)
+
+        _hessian = np.zeros((self.num_pars, self.num_pars))
+        _hessian[_ids, _ids] = (_f_diag[0] - 2.0 * _f_0 + _f_diag[1]) / _h[_ids] ** 2
+        _off_diag = (_f_off_diag[0] - _f_off_diag[1] - _f_off_diag[2] + _f_off_diag[3]) / (4.0 * _h[_ids_i] * _h[_ids_j])
+        _hessian[_ids_i, _ids_j] = _off_diag
+        _hessian[_ids_j, _ids_i] = _off_diag
+        return _hessian
+
     def _remove_zeroes_for_fixed(self, matrix):
         """
         Takes a full error matrix and removes the rows and
@@ -571,7 +615,7 @@ class MinimizerBase(object):
         if not self.did_fit:
             return None
         if self._hessian is None:
-            self._hessian = nd.Hessian(self._func_wrapper_unpack_args)(self.parameter_values)
+            self._hessian = self._compute_hessian(self.parameter_values)
             assert np.all(self._hessian == self._hessian.T)
             # Write back parameter values to nexus parameter nodes:
             self._func_wrapper_unpack_args(self.parameter_values)
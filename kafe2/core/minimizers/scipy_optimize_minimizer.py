@@ -1,6 +1,8 @@
 from __future__ import print_function
 
 import logging
+import math
+from collections import deque
 
 from ..contour import ContourFactory
 from .minimizer_base import MinimizerBase
@@ -11,9 +13,12 @@ except ImportError:
     # TODO: handle importing nonexistent minimizer
     raise
 
-import numdifftools as nd
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+_MAX_FLOAT = np.finfo(float).max
+
 
 class MinimizerScipyOptimize(MinimizerBase):
     def __init__(
@@ -32,7 +37,8 @@ class MinimizerScipyOptimize(MinimizerBase):
         self._par_constraints = []
 
         self._opt_result = None
-        self._x0 = None  # Stores initial value for x0 when profiling a parameter
+        self._x0 = None  # Stores initial value for x0 for consecutive constrained sub-fits
+        self._par_ids = {_pn: _i for _i, _pn in enumerate(parameter_names)}
         super(MinimizerScipyOptimize, self).__init__(
             parameter_names=parameter_names,
             parameter_values=parameter_values,
@@ -44,6 +50,12 @@ class MinimizerScipyOptimize(MinimizerBase):
 
     # -- private methods
 
+    def _get_par_id(self, parameter_name):
+        try:
+            return self._par_ids[parameter_name]
+        except KeyError:
+            raise ValueError("No parameter named '%s'!" % (parameter_name,))
+
     def _save_state(self):
         if self._par_val is None:
             self._save_state_dict["parameter_values"] = self._par_val
@@ -105,29 +117,27 @@ class MinimizerScipyOptimize(MinimizerBase):
     # -- public methods
 
     def set(self, parameter_name, parameter_value):
-        if parameter_name not in self._par_names:
-            raise ValueError("No parameter named '%s'!" % (parameter_name,))
-        _par_id = self._par_names.index(parameter_name)
+        _par_id = self._get_par_id(parameter_name)
         self._par_val[_par_id] = parameter_value
         self.reset()
 
     def fix(self, parameter_name):
-        _par_id = self._par_names.index(parameter_name)
+        _par_id = self._get_par_id(parameter_name)
         self._par_fixed[_par_id] = True
         self._invalidate_cache()
 
     def is_fixed(self, parameter_name):
-        _par_id = self._par_names.index(parameter_name)
+        _par_id = self._get_par_id(parameter_name)
         return self._par_fixed[_par_id]
 
     def release(self, parameter_name):
-        _par_id = self._par_names.index(parameter_name)
+        _par_id = self._get_par_id(parameter_name)
         self._par_fixed[_par_id] = False
         self._invalidate_cache()
 
     def limit(self, parameter_name, parameter_bounds):
         assert len(parameter_bounds) == 2
-        _par_id = self._par_names.index(parameter_name)
+        _par_id = self._get_par_id(parameter_name)
         if parameter_bounds[0] is not None and self._par_val[_par_id] < parameter_bounds[0]:
             self.set(parameter_name, parameter_bounds[0])
         elif parameter_bounds[1] is not None and self._par_val[_par_id] > parameter_bounds[1]:
@@ -137,7 +147,7 @@ class MinimizerScipyOptimize(MinimizerBase):
         self._par_bounds[_par_id] = parameter_bounds
 
     def unlimit(self, parameter_name):
-        _par_id = self._par_names.index(parameter_name)
+        _par_id = self._get_par_id(parameter_name)
         self._par_bounds[_par_id] = (None, None)
         _all_pars_unbounded = True
         for _par_bound in self._par_bounds:
@@ -269,7 +279,7 @@ class MinimizerScipyOptimize(MinimizerBase):
 
         _initial_points_per_axis = 1 + initial_points * 2
         _target_points_per_axis = 1 + initial_points * 2 ** (iterations + 1)
-        _ids = (self._par_names.index(parameter_name_1), self._par_names.index(parameter_name_2))
+        _ids = (self._get_par_id(parameter_name_1), self._get_par_id(parameter_name_2))
         _minimum = np.asarray([self._par_val[_ids[0]], self._par_val[_ids[1]]])
         _err = np.asarray([self.parameter_errors[_ids[0]], self.parameter_errors[_ids[1]]])
 
@@ -289,134 +299,121 @@ class MinimizerScipyOptimize(MinimizerBase):
         _y_values += _minimum[1]
 
         _grid = np.zeros((_target_points_per_axis, _target_points_per_axis)) - 1
-        _x_step = int((_target_points_per_axis - 1) / (_initial_points_per_axis - 1))
-        _y_step = int((_target_points_per_axis - 1) / (_initial_points_per_axis - 1))
-
-        _min_coords = int((_target_points_per_axis - 1) / 2)
-        _confirmed_coords = set()
-        _unsure_coords = set()
+        # _target_points_per_axis - 1 is a power-of-two multiple of _initial_points_per_axis - 1,
+        # so the steps can be halved exactly with integer arithmetic:
+        _x_step = (_target_points_per_axis - 1) // (_initial_points_per_axis - 1)
+        _y_step = _x_step
+
+        _min_coords = (_target_points_per_axis - 1) // 2
+        # Grid points are bounded integers, track their state with masks instead of sets:
+        _confirmed = np.zeros(_grid.shape, dtype=np.uint8)
+        _unsure = np.zeros(_grid.shape, dtype=np.uint8)
+        _unsure_stack = deque()
+
+        def _add_unsure(x, y):
+            if 0 <= x < _target_points_per_axis and 0 <= y < _target_points_per_axis and not _unsure[x, y]:
+                _unsure[x, y] = 1
+                _unsure_stack.append((x, y))
+
+        # The two contour parameters are removed from the sub-fits, each sub-fit starts at the
+        # result of the previous one:
+        _fixed_ids = sorted(_ids)
+        _fixed_order = [0, 1] if _ids[0] < _ids[1] else [1, 0]
+        _free_ids = [_i for _i in range(self.num_pars) if _i not in _ids]
+        _free_x = self._par_val[_free_ids]
+
+        def _profile_value(x, y):
+            # Store the result in the grid so each grid point is minimized at most once:
+            nonlocal _free_x
+            if not _confirmed[x, y]:
+                _fixed_vals = np.array([_x_values[x], _y_values[y]])[_fixed_order]
+                _grid[x, y], _free_x = self._calc_fun_with_fixed_parameters(_fixed_ids, _fixed_vals, _free_ids, _free_x)
+                _confirmed[x, y] = 1
+            return _grid[x, y]
 
         for _x in range(0, _target_points_per_axis, _x_step):
             for _y in range(0, _target_points_per_axis, _y_step):
-                _local_constraints = [
-                    {"type": "eq", "fun": lambda x: x[_ids[0]] - _x_values[_x]},
-                    {"type": "eq", "fun": lambda x: x[_ids[1]] - _y_values[_y]},
-                ]
-                _grid[_x, _y] = self._calc_fun_with_constraints(_local_constraints)
+                _profile_value(_x, _y)
 
         _min_fun = min(self.function_value, _grid[_min_coords, _min_coords])
         _contour_fun = _min_fun + sigma**2
 
         _iterations = 0
         while _x_step > 0 and _y_step > 1:
+            _x_half = _x_step >> 1
+            _y_half = _y_step >> 1
             if _iterations % 2 == 0:
-                _x_0 = int(_x_step / 2)
-                _y_0 = int(_y_step / 2)
-                _vector_1 = (int(_x_step / 2), int(_y_step / 2))
-                _vector_2 = (int(_x_step / 2), -int(_y_step / 2))
+                _x_0 = _x_half
+                _y_0 = _y_half
+                _vector_1 = (_x_half, _y_half)
+                _vector_2 = (_x_half, -_y_half)
             else:
                 _x_0 = 0
                 _y_0 = 0
                 _vector_1 = (_x_step, 0)
-                _vector_2 = (0, int(_y_step / 2))
+                _vector_2 = (0, _y_half)
 
             for _x in range(_x_0, _target_points_per_axis, _x_step):
                 if _iterations % 2 == 1 and _x % (2 * _x_step) == 0:
-                    _current_y_0 = _y_0 + int(_y_step / 2)
+                    _current_y_0 = _y_0 + _y_half
                 else:
                     _current_y_0 = _y_0
                 for _y in range(_current_y_0, _target_points_per_axis, _y_step):
                     _point_value = self._heuristic_point_evaluation(_contour_fun, _grid, _x, _y, _vector_1, _vector_2)
                     if _point_value == -1:
-                        _local_constraints = [
-                            {"type": "eq", "fun": lambda x: x[_ids[0]] - _x_values[_x]},
-                            {"type": "eq", "fun": lambda x: x[_ids[1]] - _y_values[_y]},
-                        ]
-                        _grid[_x, _y] = self._calc_fun_with_constraints(_local_constraints)
-                        _confirmed_coords.add((_x, _y))
+                        _profile_value(_x, _y)
                         if _iterations % 2 == 0:
-                            _unsure_coords.add((_x - _x_step, _y))
-                            _unsure_coords.add((_x, _y - _y_step))
-                            _unsure_coords.add((_x + _x_step, _y))
-                            _unsure_coords.add((_x, _y + _y_step))
+                            _add_unsure(_x - _x_step, _y)
+                            _add_unsure(_x, _y - _y_step)
+                            _add_unsure(_x + _x_step, _y)
+                            _add_unsure(_x, _y + _y_step)
                         else:
-                            _unsure_coords.add((_x - _x_step, _y - int(_y_step / 2)))
-                            _unsure_coords.add((_x - _x_step, _y + int(_y_step / 2)))
-                            _unsure_coords.add((_x + _x_step, _y - int(_y_step / 2)))
-                            _unsure_coords.add((_x + _x_step, _y + int(_y_step / 2)))
+                            _add_unsure(_x - _x_step, _y - _y_half)
+                            _add_unsure(_x - _x_step, _y + _y_half)
+                            _add_unsure(_x + _x_step, _y - _y_half)
+                            _add_unsure(_x + _x_step, _y + _y_half)
                     else:
                         _grid[_x, _y] = _point_value
 
-            while _unsure_coords:
-                _current_coords = _unsure_coords.pop()
-                if (
-                    _current_coords[0] < 0
-                    or _current_coords[0] >= _target_points_per_axis
-                    or _current_coords[1] < 0
-                    or _current_coords[1] >= _target_points_per_axis
-                ):
+            while _unsure_stack:
+                _x, _y = _unsure_stack.pop()
+                _unsure[_x, _y] = 0
+                if _confirmed[_x, _y]:
                     continue
-                if _current_coords in _confirmed_coords:
-                    continue
-                _x = _current_coords[0]
-                _y = _current_coords[1]
-                _local_constraints = [
-                    {"type": "eq", "fun": lambda x: x[_ids[0]] - _x_values[_x]},
-                    {"type": "eq", "fun": lambda x: x[_ids[1]] - _y_values[_y]},
-                ]
-                _current_fun = self._calc_fun_with_constraints(_local_constraints)
-                _grid_fun = _grid[_current_coords[0], _current_coords[1]]
+                _grid_fun = _grid[_x, _y]
+                _current_fun = _profile_value(_x, _y)
                 if (_current_fun > _contour_fun and _grid_fun < _contour_fun) or (_current_fun < _contour_fun and _grid_fun > _contour_fun):
                     if _iterations % 2 == 0:
-                        _unsure_coords.add((_x - _x_step, _y))
-                        _unsure_coords.add((_x, _y - _y_step))
-                        _unsure_coords.add((_x + _x_step, _y))
-                        _unsure_coords.add((_x, _y + _y_step))
+                        _add_unsure(_x - _x_step, _y)
+                        _add_unsure(_x, _y - _y_step)
+                        _add_unsure(_x + _x_step, _y)
+                        _add_unsure(_x, _y + _y_step)
                     else:
-                        _unsure_coords.add((_x - _x_step, _y - int(_y_step / 2)))
-                        _unsure_coords.add((_x - _x_step, _y + int(_y_step / 2)))
-                        _unsure_coords.add((_x + _x_step, _y - int(_y_step / 2)))
-                        _unsure_coords.add((_x + _x_step, _y + int(_y_step / 2)))
-                _grid[_current_coords[0], _current_coords[1]] = _current_fun
-                _confirmed_coords.add(_current_coords)
+                        _add_unsure(_x - _x_step, _y - _y_half)
+                        _add_unsure(_x - _x_step, _y + _y_half)
+                        _add_unsure(_x + _x_step, _y - _y_half)
+                        _add_unsure(_x + _x_step, _y + _y_half)
 
             if _iterations % 2 == 0:
-                _x_step = int(_x_step / 2)
+                _x_step >>= 1
             else:
-                _y_step = int(_y_step / 2)
+                _y_step >>= 1
             _iterations += 1
 
-        _left_cutoff = 0
-        _right_cutoff = _target_points_per_axis - 1
-        _bottom_cutoff = 0
-        _top_cutoff = _target_points_per_axis - 1
         _padding = int(3 / area_scale_factor * max(1, 2 ** (iterations - 4)))
 
-        while _right_cutoff > 0 and np.min(_grid[_right_cutoff]) > _contour_fun:
-            _right_cutoff -= 1
-        _right_cutoff += _padding
-        _right_cutoff = min(_right_cutoff, _target_points_per_axis - 1)
-
-        while _left_cutoff < _right_cutoff and np.min(_grid[_left_cutoff]) > _contour_fun:
-            _left_cutoff += 1
-        _left_cutoff -= _padding
-        _left_cutoff = max(_left_cutoff, 0)
+        def _cutoffs(minima):
+            # Find the first and last row/column with values inside the contour, then add padding:
+            _inside = ~(minima > _contour_fun)
+            _high = len(minima) - 1 - np.argmax(_inside[::-1]) if np.any(_inside) else 0
+            _high = min(_high + _padding, _target_points_per_axis - 1)
+            _low = np.argmax(_inside[:_high]) if np.any(_inside[:_high]) else _high
+            return max(_low - _padding, 0), _high
 
+        _left_cutoff, _right_cutoff = _cutoffs(np.min(_grid, axis=1))
         _grid = _grid[_left_cutoff:_right_cutoff]
-        _grid = _grid.T
-
-        while _top_cutoff > 0 and np.min(_grid[_top_cutoff]) > _contour_fun:
-            _top_cutoff -= 1
-        _top_cutoff += _padding
-        _top_cutoff = min(_top_cutoff, _target_points_per_axis - 1)
-
-        while _bottom_cutoff < _top_cutoff and np.min(_grid[_bottom_cutoff]) > _contour_fun:
-            _bottom_cutoff += 1
-        _bottom_cutoff -= _padding
-        _bottom_cutoff = max(_bottom_cutoff, 0)
-
-        _grid = _grid[_bottom_cutoff:_top_cutoff]
-        _grid = _grid.T
+        _bottom_cutoff, _top_cutoff = _cutoffs(np.min(_grid, axis=0))
+        _grid = _grid[:, _bottom_cutoff:_top_cutoff]
 
         _x_values = _x_values[_left_cutoff:_right_cutoff]
         _y_values = _y_values[_bottom_cutoff:_top_cutoff]
@@ -436,33 +433,17 @@ class MinimizerScipyOptimize(MinimizerBase):
 
     @staticmethod
     def _get_adjacent_grid_points(grid, x_0, y_0, vector_1, vector_2):
-        _x_size = np.ma.size(grid, 0)
-        _y_size = np.ma.size(grid, 1)
-        _grid_points = []
-        for i in range(4):
-            _x = x_0
-            _y = y_0
-            if i == 0:
-                _x -= vector_1[0]
-                _y -= vector_1[1]
-            elif i == 1:
-                _x -= vector_2[0]
-                _y -= vector_2[1]
-            elif i == 2:
-                _x += vector_1[0]
-                _y += vector_1[1]
-            elif i == 3:
-                _x += vector_2[0]
-                _y += vector_2[1]
-            if _x >= 0 and _x < _x_size and _y >= 0 and _y < _y_size:
-                _grid_points.append(grid[_x][_y])
-        return np.asarray(_grid_points)
+        _offsets = np.array([vector_1, vector_2])
+        _points = np.array([x_0, y_0]) + np.concatenate([-_offsets, _offsets])
+        _mask = np.all((_points >= 0) & (_points < grid.shape), axis=1)
+        return grid[_points[_mask, 0], _points[_mask, 1]]
 
     def _contour_beacon(self, parameter_name_1, parameter_name_2, sigma=1.0, beacon_size=0.02):
-        _contour_fun = self.function_value + sigma**2
-        _contour_fun_upper_tolerance = self.function_value + (1.2 * sigma) ** 2
-        _contour_fun_lower_tolerance = self.function_value + (0.8 * sigma) ** 2
-        _ids = (self._par_names.index(parameter_name_1), self._par_names.index(parameter_name_2))
+        _min_fun = self.function_value
+        _contour_fun = _min_fun + sigma**2
+        _contour_fun_upper_tolerance = _min_fun + (1.2 * sigma) ** 2
+        _contour_fun_lower_tolerance = _min_fun + (0.8 * sigma) ** 2
+        _ids = (self._get_par_id(parameter_name_1), self._get_par_id(parameter_name_2))
         _minimum = np.asarray([self._par_val[_ids[0]], self._par_val[_ids[1]]])
         _err = np.asarray([self._par_err[_ids[0]], self._par_err[_ids[1]]])
 
@@ -480,20 +461,27 @@ class MinimizerScipyOptimize(MinimizerBase):
 
         _termination_distance = (sigma * CONTOUR_STRETCHING * beacon_size) ** 2
 
-        _meta_cost_function = lambda z: (  # noqa: E731 (do not assign labda)
-            _contour_fun
-            - self._calc_fun_with_constraints(
-                [
-                    {"type": "eq", "fun": lambda x: x[_ids[0]] - (_minimum[0] + _err[0] * z)},
-                    {"type": "eq", "fun": lambda x: x[_ids[1]] - _minimum[1]},
-                ]
-            )
-        )
+        # The constraints are created once, only their target values are updated for each sub-fit:
+        _targets = np.zeros(2)
+        _point_constraints = [
+            {"type": "eq", "fun": lambda x: x[_ids[0]] - _targets[0]},
+            {"type": "eq", "fun": lambda x: x[_ids[1]] - _targets[1]},
+        ]
+
+        # Consecutive sub-fits are close to each other, start each one at the previous result:
+        self._x0 = self._par_val
+
+        def _sigma_profile(sigma_coords):
+            _targets[:] = self._transform_coordinates(_minimum, sigma_coords, _err)
+            return self._calc_fun_with_constraints(_point_constraints, continuous_x0=True)
+
+        def _meta_cost_function(z):
+            return _contour_fun - _sigma_profile(np.asarray([z, 0.0]))
 
         _start_x = opt.brentq(_meta_cost_function, 0, 2 * sigma, maxiter=1000)
         _start_point = np.asarray([_start_x, 0.0])
 
-        _phi = self._calculate_tangential_angle(_start_point, _ids)
+        _derivative_step = 0.5 * sigma * CONTOUR_STRETCHING * beacon_size
         _coords = _start_point
         _curvature_adjustion = 1.0
         _last_backtrack = 0
@@ -503,20 +491,18 @@ class MinimizerScipyOptimize(MinimizerBase):
         _contour_coords = [_start_point]
 
         while True:
-            _transformed_search_ellipse = self._rotate_clockwise(_contour_search_ellipse * _curvature_adjustion, _phi)
-            _transformed_search_ellipse[0] += _coords[0]
-            _transformed_search_ellipse[1] += _coords[1]
-            _transformed_search_ellipse = _transformed_search_ellipse.T
-            _ellipse_fun_values = np.empty(CONTOUR_ELLIPSE_POINTS)
-            for i in range(CONTOUR_ELLIPSE_POINTS):
-                _ellipse_coords = _transformed_search_ellipse[i]
-                _transformed_coords = self._transform_coordinates(_minimum, _ellipse_coords, _err)
-                _point_constraints = [
-                    {"type": "eq", "fun": lambda x: x[_ids[0]] - _transformed_coords[0]},
-                    {"type": "eq", "fun": lambda x: x[_ids[1]] - _transformed_coords[1]},
-                ]
-                _ellipse_fun_values[i] = self._calc_fun_with_constraints(_point_constraints)
+            # Approximate the profile around the current point with a second order Taylor expansion
+            # instead of running a sub-fit for every point of the search ellipse:
+            _fun_0, _grad, _hessian = self._profile_derivatives(_sigma_profile, _coords, _derivative_step)
+            _phi = np.arctan2(_grad[0], _grad[1]) + np.pi / 2
+            _search_offsets = self._rotate_clockwise(_contour_search_ellipse * _curvature_adjustion, _phi).T
+            _transformed_search_ellipse = _search_offsets + _coords
+            _ellipse_fun_values = _fun_0 + _search_offsets @ _grad + 0.5 * np.einsum("pi,ij,pj->p", _search_offsets, _hessian, _search_offsets)
             _min_index = np.argmin(np.abs(_ellipse_fun_values - _contour_fun))
+            # Refine the choice with the exact profile at the best point and its neighbors:
+            _candidates = np.arange(max(_min_index - 1, 0), min(_min_index + 2, CONTOUR_ELLIPSE_POINTS))
+            _candidate_fun_values = [_sigma_profile(_transformed_search_ellipse[_i]) for _i in _candidates]
+            _min_index = _candidates[np.argmin(np.abs(np.asarray(_candidate_fun_values) - _contour_fun))]
             _new_coords = _transformed_search_ellipse[_min_index]
 
             _curvature_adjustion *= _curvature_adjustion_factors[_min_index]
@@ -524,15 +510,12 @@ class MinimizerScipyOptimize(MinimizerBase):
                 _curvature_adjustion = 1.0
 
             if _stretched_absolute_angles[_min_index] > 0.349111:
-                print("BACKTRACK")
+                logger.debug("Contour beacon backtracking at loop %d", _loops)
                 _contour_coords = _contour_coords[0:-1]
             else:
                 _contour_coords.append(_new_coords)
 
-            # _delta = _contour_coords[-1] - _contour_coords[-2]
-            # _phi = np.arctan2(_delta[0], _delta[1])
             _coords = _contour_coords[-1]
-            _phi = self._calculate_tangential_angle(_coords, _ids)
 
             if np.sum((_coords - _start_point) ** 2) < _termination_distance and _loops > 10:
                 break
@@ -550,33 +533,38 @@ class MinimizerScipyOptimize(MinimizerBase):
 
     @staticmethod
     def _transform_contour(minimum, sigma_contour, errors):
-        _transformed_contour = []
-        for _coords in sigma_contour:
-            _transformed_contour.append(MinimizerScipyOptimize._transform_coordinates(minimum, _coords, errors))
-        return _transformed_contour
+        return MinimizerScipyOptimize._transform_coordinates(minimum, np.asarray(sigma_contour), errors)
 
     @staticmethod
     def _rotate_clockwise(xy_values, phi):
-        _rotated_xy_values = np.empty(shape=xy_values.shape)
-        _rotated_xy_values[0] = np.cos(phi) * xy_values[0] + np.sin(phi) * xy_values[1]
-        _rotated_xy_values[1] = -np.sin(phi) * xy_values[0] + np.cos(phi) * xy_values[1]
-        return _rotated_xy_values
-
-    def _calculate_tangential_angle(self, coords, ids):
-        _meta_cost_function_gradient = lambda pars: self._calc_fun_with_constraints(  # noqa: E731 (do not assign labda)
-            [
-                {
-                    "type": "eq",
-                    "fun": lambda x: x[ids[0]] - (self._par_val[ids[0]] + self._par_err[ids[0]] * pars[0]),
-                },
-                {
-                    "type": "eq",
-                    "fun": lambda x: x[ids[1]] - (self._par_val[ids[1]] + self._par_err[ids[1]] * pars[1]),
-                },
-            ]
-        )
-        _grad = nd.Gradient(_meta_cost_function_gradient)(coords)
-        return np.arctan2(_grad[0], _grad[1]) + np.pi / 2
+        _cos_phi = np.cos(phi)
+        _sin_phi = np.sin(phi)
+        return np.array([[_cos_phi, _sin_phi], [-_sin_phi, _cos_phi]]) @ xy_values
+
+    @staticmethod
+    def _profile_derivatives(profile_function, coords, step):
+        """
+        Calculate the value, gradient and Hessian matrix of a two-dimensional profile with central
+        finite differences. Needs 7 evaluations of the profile.
+        :param profile_function: the profile to differentiate.
+        :type profile_function: callable that takes a numpy.ndarray of shape (2,) and returns a float
+        :param coords: the point at which to differentiate the profile.
+        :type coords: numpy.ndarray of shape (2,)
+        :param step: the finite difference step size.
+        :type step: float
+        :return: the profile value, gradient, and Hessian matrix.
+        :rtype: tuple of float, numpy.ndarray of shape (2,), and numpy.ndarray of shape (2, 2)
+        """
+        _fun_0 = profile_function(coords)
+        _fun_plus = np.asarray([profile_function(coords + step * _e) for _e in np.eye(2)])
+        _fun_minus = np.asarray([profile_function(coords - step * _e) for _e in np.eye(2)])
+        _fun_plus_plus = profile_function(coords + step)
+        _fun_minus_minus = profile_function(coords - step)
+
+        _grad = (_fun_plus - _fun_minus) / (2 * step)
+        _hessian = np.diag((_fun_plus - 2 * _fun_0 + _fun_minus) / step**2)
+        _hessian[0, 1] = _hessian[1, 0] = (_fun_plus_plus - np.sum(_fun_plus) + 2 * _fun_0 - np.sum(_fun_minus) + _fun_minus_minus) / (2 * step**2)
+        return _fun_0, _grad, _hessian
 
     def _calc_fun_with_constraints(self, additional_constraints, continuous_x0=False):
         _local_constraints = self._par_constraints + additional_constraints
@@ -599,6 +587,47 @@ class MinimizerScipyOptimize(MinimizerBase):
         self._x0 = _result.x
         return _result.fun
 
+    def _reduced_objective(self, fixed_ids, fixed_vals):
+        """
+        Create the cost function of the parameters that are not in fixed_ids. The parameters in
+        fixed_ids are inserted with the values in fixed_vals before calling the cost function.
+        :param fixed_ids: the sorted indices of the parameters to hold constant.
+        :type fixed_ids: sequence of int
+        :param fixed_vals: the values of the parameters to hold constant.
+        :type fixed_vals: numpy.ndarray
+        :return: the cost function of the remaining parameters.
+        :rtype: callable that takes a numpy.ndarray and returns a float
+        """
+        _insert_ids = np.asarray(fixed_ids) - np.arange(len(fixed_ids))
+
+        def _reduced_func(free_vals):
+            return self._func_wrapper_unpack_args(np.insert(free_vals, _insert_ids, fixed_vals))
+
+        return _reduced_func
+
+    def _calc_fun_with_fixed_parameters(self, fixed_ids, fixed_vals, free_ids, x0):
+        """
+        Minimize the cost function while holding the parameters in fixed_ids constant. Unlike
+        _calc_fun_with_constraints the fixed parameters are removed from the problem instead of being
+        enforced with equality constraints.
+        :param fixed_ids: the sorted indices of the parameters to hold constant.
+        :type fixed_ids: sequence of int
+        :param fixed_vals: the values of the parameters to hold constant.
+        :type fixed_vals: numpy.ndarray
+        :param free_ids: the indices of all other parameters.
+        :type free_ids: sequence of int
+        :param x0: starting values for the free parameters.
+        :type x0: numpy.ndarray
+        :return: the minimal cost function value and the corresponding free parameter values.
+        :rtype: tuple of float and numpy.ndarray
+        """
+        _reduced_func = self._reduced_objective(fixed_ids, fixed_vals)
+        if len(free_ids) == 0:
+            return _reduced_func(x0), x0
+        _bounds = None if self._par_bounds is None else [self._par_bounds[_i] for _i in free_ids]
+        _result = opt.minimize(_reduced_func, x0, method="L-BFGS-B", bounds=_bounds, tol=self.tolerance)
+        return _result.fun, _result.x
+
     def profile(
         self,
         parameter_name,
@@ -613,7 +642,7 @@ class MinimizerScipyOptimize(MinimizerBase):
         if not self.did_fit:
             raise RuntimeError("Need to perform a fit before calling profile()!")
         self._save_state()
-        _par_id = self._par_names.index(parameter_name)
+        _par_id = self._get_par_id(parameter_name)
         _y_offset = self.function_value if subtract_min else 0
         _bound_low, _bound_high, _arrow_specs = self._get_profile_bound(parameter_name, low, high, sigma, cl, arrows)
         self._load_state()
@@ -621,8 +650,11 @@ class MinimizerScipyOptimize(MinimizerBase):
 
         _y = np.zeros(size)
         self._x0 = self._par_val
+        _target = np.zeros(1)
+        _profile_constraints = [{"type": "eq", "fun": lambda x: x[_par_id] - _target[0]}]
         for i in range(size):
-            _y[i] = self._calc_fun_with_constraints([{"type": "eq", "fun": lambda x: x[_par_id] - _par[i]}], continuous_x0=True)
+            _target[0] = _par[i]
+            _y[i] = self._calc_fun_with_constraints(_profile_constraints, continuous_x0=True)
         self._load_state()
         return np.asarray([_par, _y - _y_offset]), _arrow_specs
 
@@ -630,14 +662,14 @@ class MinimizerScipyOptimize(MinimizerBase):
         """call FCN, but ensure fixed parameters are passed with their fixed value"""
         # Note: this is needed in order to ensure that derivatives of `_func_wrapper`
         #       take parameter fixing into account
-        assert len(self.parameter_values) == len(self._par_fixed) == len(parameter_values)
+        # Use self._par_val directly, the parameter_values property returns a copy on each call:
+        assert len(self._par_val) == len(self._par_fixed) == len(parameter_values)
         # replace parameter values
         parameter_values = [
-            _fixed_val if _is_fixed else _call_val
-            for _call_val, _fixed_val, _is_fixed in zip(parameter_values, self.parameter_values, self._par_fixed)
+            _fixed_val if _is_fixed else _call_val for _call_val, _fixed_val, _is_fixed in zip(parameter_values, self._par_val, self._par_fixed)
         ]
         _res = MinimizerBase._func_wrapper(self, *parameter_values)
         # some scipy methods handle 'nan' incorrectly -> return MAX_FLOAT instead
-        if np.isnan(_res):
-            return np.finfo(float).max
+        if math.isnan(_res):
+            return _MAX_FLOAT
         return _res
@@ -3,6 +3,7 @@ import warnings
 import numpy as np
 import six
 from scipy.linalg import solve_triangular
+from scipy.special import xlogy
 from scipy.stats import chi2, norm, poisson
 
 from ..io.file import FileIOMixin
@@ -612,9 +613,11 @@ class CostFunction_NegLogLikelihood(CostFunction):
 
     @staticmethod
     def nllr_poisson(data, model):
-        _total_log_likelihood = np.sum(poisson.logpmf(k=data, mu=model, loc=0.0))
-        _saturated_log_likelihood = np.sum(poisson.logpmf(k=data, mu=data, loc=0.0))
-        _log_likelihood_ratio = _total_log_likelihood - _saturated_log_likelihood
+        # Baker-Cousins form of the likelihood ratio: the log-gamma terms of the likelihood and the
+        # saturated likelihood cancel out exactly so they are not calculated in the first place.
+        if np.any(model < 0):
+            return np.inf
+        _log_likelihood_ratio = np.sum(xlogy(data, model) - xlogy(data, data) + data - model)
         # guard against returning NaN
         if np.isnan(_log_likelihood_ratio):
             return np.inf
@@ -17,7 +17,7 @@ from matplotlib.legend_handler import HandlerBase
 
 from ...config import ConfigError, kafe2_rc, kc
 from ..multi.fit import MultiFit
-from ..util.wrapper import _fit_history
+from ..util.wrapper import _get_fit_history_entries
 from .container import DataContainerBase
 from .format import ParameterFormatter
 
@@ -726,10 +726,7 @@ class Plot:
         else:
             self._multifit = None
         if isinstance(fit_objects, int):
-            if fit_objects >= 0:
-                fit_objects = [_fit_history[fit_objects]["fit"]]
-            else:
-                fit_objects = [_f["fit"] for _f in _fit_history[fit_objects:]]
+            fit_objects = [_f["fit"] for _f in _get_fit_history_entries(fit_objects)]
         try:
             iter(fit_objects)
         except TypeError:
@@ -7,6 +7,15 @@ from ..xy import XYContainer, XYFit
 
 __all__ = ["Fit"]
 
+_CONTAINER_TO_FIT = {
+    IndexedContainer: IndexedFit,
+    HistContainer: HistFit,
+    UnbinnedContainer: UnbinnedFit,
+    XYContainer: XYFit,
+    list: XYFit,
+    np.ndarray: XYFit,
+}
+
 
 def Fit(data=None, model_function=None, minimizer=None, **kwargs):
     """A convenience wrapper for simple fit creation. For more control over the fit creation use the corresponding Fit
@@ -22,18 +31,9 @@ def Fit(data=None, model_function=None, minimizer=None, **kwargs):
     :param kwargs: Any further keyword arguments for the according fit types. For more information, refer to their
         respective documentation.
     """
-    container_to_fit = {
-        IndexedContainer: IndexedFit,
-        HistContainer: HistFit,
-        UnbinnedContainer: UnbinnedFit,
-        XYContainer: XYFit,
-        list: XYFit,
-        np.ndarray: XYFit,
-    }
-    try:
-        fit_class = container_to_fit[type(data)]
-    except KeyError:
-        raise TypeError("Unknown or unsupported data container type {}." "Supported types are {}".format(type(data), container_to_fit.keys()))
+    fit_class = _CONTAINER_TO_FIT.get(type(data), None)
+    if fit_class is None:
+        raise TypeError("Unknown or unsupported data container type {}. Supported types are {}".format(type(data), _CONTAINER_TO_FIT.keys()))
     # other errors will raise during creation of the fit object
     if model_function is None:
         return fit_class(data, minimizer=minimizer, **kwargs)  # use default model function
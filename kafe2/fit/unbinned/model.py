@@ -16,16 +16,13 @@ class UnbinnedParametricModel(ParametricModelBaseMixin, UnbinnedContainer):
     ):
         self.support = np.array(data)
 
-        _model = model_density_function(self.support, *model_parameters)
-        if np.isscalar(_model):
-            _model = np.ones_like(self.support) * _model
-
         super(UnbinnedParametricModel, self).__init__(
             # this gets passed to ParametricModelBaseMixin.__init__
             model_func=model_density_function,
             model_parameters=model_parameters,
             # this gets passed to UnbinnedContainer.__init__
-            data=_model,
+            # the model values are calculated lazily the first time 'data' is accessed
+            data=np.zeros_like(self.support, dtype=float),
         )
 
     # -- private methods
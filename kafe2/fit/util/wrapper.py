@@ -5,7 +5,7 @@ These functions provide pre-configured pipelines for the most common use cases a
 the user to manually manage objects.
 """
 
-__all__ = ["custom_fit", "hist_fit", "indexed_fit", "unbinned_fit", "xy_fit", "plot", "k2Fit"]
+__all__ = ["custom_fit", "hist_fit", "indexed_fit", "unbinned_fit", "xy_fit", "plot", "k2Fit", "clear_fit_history"]
 
 try:
     import typing  # help IDEs with type-hinting inside docstrings  # noqa: F401 (unused import)
@@ -14,12 +14,31 @@ except ImportError:
 
 import os
 import warnings
+from collections import deque
 from copy import deepcopy
 from glob import glob
 
 import numpy as np
 
-_fit_history = []
+# only the most recent fits are kept so that long sessions do not keep every fit object alive
+_FIT_HISTORY_MAX_LENGTH = 64
+_fit_history = deque(maxlen=_FIT_HISTORY_MAX_LENGTH)
+
+
+def clear_fit_history():
+    """Remove all fits performed with the wrapper functions from the fit history.
+    Fit indices start again at 0 afterwards."""
+    _fit_history.clear()
+
+
+def _get_fit_history_entries(fits):
+    """Get the fit history entries selected by the integer `fits`, see :py:func:`plot`."""
+    if fits < 0:
+        return list(_fit_history)[fits:]
+    _position = fits - _fit_history[0]["index"] if _fit_history else fits
+    if _position < 0:
+        raise IndexError(f"Fit {fits} was removed from the fit history, only the last {_FIT_HISTORY_MAX_LENGTH} fits are kept.")
+    return [_fit_history[_position]]
 
 
 def _get_file_index():
@@ -67,7 +86,8 @@ def _fit_wrapper_generic(fit, p0, dp0, limits, fixed, constraints, report, profi
     else:
         _file_index = None
 
-    _fit_history.append(dict(fit=fit, profile=profile, file_index=_file_index))
+    _index = _fit_history[-1]["index"] + 1 if _fit_history else 0
+    _fit_history.append(dict(fit=fit, profile=profile, file_index=_file_index, index=_index))
 
     return _fit_results
 
@@ -78,9 +98,7 @@ def _add_error_to_fit_generic(fit, error, errors_rel_to_model, correlated=False,
     error = np.asarray(error)
     _reference = "model" if errors_rel_to_model and relative else "data"
     if correlated:
-        if error.ndim == 0:
-            error = np.reshape(error, (1,))
-        for _err in error:
+        for _err in np.atleast_1d(error):
             fit.add_error(_err, correlation=1.0, relative=relative, reference=_reference)
     else:
         if error.ndim == 2:
@@ -153,6 +171,7 @@ def hist_fit(
     error_cor_rel=None,
     errors_rel_to_model=True,
     density=True,
+    bin_evaluation="simpson",
     gauss_approximation=None,
     limits=None,
     fixed=None,
@@ -200,6 +219,10 @@ def hist_fit(
     :param density: whether the model is a probability density function and the data should be
         normalized to match it.
     :type density: bool
+    :param bin_evaluation: how the model evaluates bin heights. Either the name of a quadrature
+        formula (``"rectangle"``, ``"midpoint"``, ``"trapezoid"``, ``"simpson"``), ``"numerical"``
+        for numerical integration, or the antiderivative of the model function.
+    :type bin_evaluation: str, callable, or numpy.vectorize
     :param limits: limits to be applied to the model parameter. The expected format for each limit
         is an iterable consisting of the parameter name, the lower bound, and then the upper bound.
         An iterable of limits can be passed to limit multiple parameters.
@@ -233,9 +256,9 @@ def hist_fit(
     _cost_function = "gauss_approximation" if gauss_approximation else "poisson"
 
     if model_function is None:
-        _fit = HistFit(data, cost_function=_cost_function, density=density)
+        _fit = HistFit(data, cost_function=_cost_function, bin_evaluation=bin_evaluation, density=density)
     else:
-        _fit = HistFit(data, model_function, cost_function=_cost_function, density=density)
+        _fit = HistFit(data, model_function, cost_function=_cost_function, bin_evaluation=bin_evaluation, density=density)
 
     _add_error_to_fit_generic(_fit, error, errors_rel_to_model)
     _add_error_to_fit_generic(_fit, error_cor, errors_rel_to_model, correlated=True)
@@ -427,14 +450,10 @@ def xy_fit(
         _fit = XYFit([x_data, y_data], model_function)
 
     def _add_error_to_fit(axis, error, correlated=False, relative=False):
-        if error is None:
-            return
         error = np.asarray(error)
         _reference = "model" if errors_rel_to_model and axis == "y" and relative else "data"
         if correlated:
-            if error.ndim == 0:
-                error = np.reshape(error, (1,))
-            for _err in error:
+            for _err in np.atleast_1d(error):
                 _fit.add_error(axis, _err, correlation=1.0, relative=relative, reference=_reference)
         else:
             if error.ndim == 2:
@@ -442,14 +461,18 @@ def xy_fit(
             else:
                 _fit.add_error(axis, error, relative=relative, reference=_reference)
 
-    _add_error_to_fit("x", x_error)
-    _add_error_to_fit("y", y_error)
-    _add_error_to_fit("x", x_error_rel, relative=True)
-    _add_error_to_fit("y", y_error_rel, relative=True)
-    _add_error_to_fit("x", x_error_cor, correlated=True)
-    _add_error_to_fit("y", y_error_cor, correlated=True)
-    _add_error_to_fit("x", x_error_cor_rel, correlated=True, relative=True)
-    _add_error_to_fit("y", y_error_cor_rel, correlated=True, relative=True)
+    for _axis, _error, _correlated, _relative in (
+        ("x", x_error, False, False),
+        ("y", y_error, False, False),
+        ("x", x_error_rel, False, True),
+        ("y", y_error_rel, False, True),
+        ("x", x_error_cor, True, False),
+        ("y", y_error_cor, True, False),
+        ("x", x_error_cor_rel, True, True),
+        ("y", y_error_cor_rel, True, True),
+    ):
+        if _error is not None:
+            _add_error_to_fit(_axis, _error, correlated=_correlated, relative=_relative)
 
     if profile is None:
         profile = x_error is not None or x_error_rel is not None or y_error_rel is not None
@@ -488,8 +511,9 @@ def plot(
 
     :param fits: which kafe2 fits to use for the plot. A positive integer is interpreted as the fit
         with the given index that has been performed (with wrappers) since the program started. A
-        negative integer *-n* is interpreted as the last *n* fits. kafe2 fit objects are used
-        directly.
+        negative integer *-n* is interpreted as the last *n* fits. The fit history is bounded, fits
+        that have been removed from it to make room for newer fits can no longer be selected by
+        index. kafe2 fit objects are used directly.
     :type fits: int or :py:class:`~kafe2.fit._base.FitBase`
         or Sequence[:py:class:`~kafe2.fit._base.FitBase`]
     :param x_label: the *x* axis label.
@@ -552,15 +576,10 @@ def plot(
     _fit_profiles = None
     _file_indices = None
     if isinstance(fits, int):
-        if fits >= 0:
-            _fit_profiles = [_fit_history[fits]["profile"]]
-            _file_indices = [_fit_history[fits]["file_index"]]
-            fits = [_fit_history[fits]["fit"]]
-        else:
-            fits = _fit_history[fits:]
-            _fit_profiles = [_f["profile"] for _f in fits]
-            _file_indices = [_f["file_index"] for _f in fits]
-            fits = [_f["fit"] for _f in fits]
+        fits = _get_fit_history_entries(fits)
+        _fit_profiles = [_f["profile"] for _f in fits]
+        _file_indices = [_f["file_index"] for _f in fits]
+        fits = [_f["fit"] for _f in fits]
     else:
         try:
             iter(fits)
@@ -5,8 +5,8 @@ except ImportError:
     pass
 import matplotlib as mpl
 import numpy as np
+import scipy.linalg
 import scipy.stats
-import six
 from matplotlib import gridspec as gs
 from matplotlib import pyplot as plt
 
@@ -19,22 +19,19 @@ __all__ = ["XYFitEnsemble"]
 
 
 def _heuristic_optimal_subplot_grid_size(n_subplots, aspect_ratio_priority=0.5):
-    def f2(s, k):
-        if n_subplots > s * (s + k):
-            return 100000
-        return (s * (s + k) - n_subplots) ** 2 * (1.0 - aspect_ratio_priority) + (float(k) / float(s)) ** 2 * (aspect_ratio_priority)
+    if n_subplots < 2:
+        return n_subplots, n_subplots
 
-    _optimal_f = np.inf
-    _optimal_sk = n_subplots, 0
-    for s in six.moves.range(1, n_subplots):
-        for k in six.moves.range(0, n_subplots):
-            _f = f2(s, k)
-            if _f < _optimal_f:
-                _optimal_f = _f
-                _optimal_sk = s, k
+    # evaluate the cost for all grids with `s` rows and `s + k` columns at once
+    s = np.arange(1, n_subplots)[:, np.newaxis]
+    k = np.arange(0, n_subplots)[np.newaxis, :]
+    _n_cells = s * (s + k)
+    _f = (_n_cells - n_subplots) ** 2 * (1.0 - aspect_ratio_priority) + (k / s) ** 2 * aspect_ratio_priority
+    _f = np.where(n_subplots > _n_cells, 100000, _f)
 
-    s, k = _optimal_sk
-    return s, s + k
+    # `argmin` returns the first minimum, same as the previous brute-force loop
+    _i_s, _i_k = np.unravel_index(np.argmin(_f), _f.shape)
+    return int(s[_i_s, 0]), int(s[_i_s, 0] + k[0, _i_k])
 
 
 class XYFitEnsembleException(FitEnsembleException):
@@ -84,6 +81,7 @@ class XYFitEnsemble(FitEnsembleBase):
         model_parameters,
         cost_function=XYCostFunction_Chi2(axes_to_use="y", errors_to_use="covariance"),
         requested_results=None,
+        seed=None,
     ):
         """Construct an :py:obj:`~kafe2.fit.XYFitEnsemble` object.
 
@@ -105,6 +103,9 @@ class XYFitEnsemble(FitEnsembleBase):
         :param requested_results: List of result variables to collect for each toy fit. If
             :py:obj:`None` it will default to ``('y_pulls', 'parameter_pulls', 'cost')``.
         :type requested_results: typing.Sequence[str] or None.
+        :param seed: Seed for the random number generator used to generate the pseudo-data. If
+            :py:obj:`None`, the generator is seeded with fresh entropy from the operating system.
+        :type seed: int or None
         """
         self._n_exp = n_experiments
         self._ref_x_data = np.asarray(x_support, dtype=float)
@@ -112,6 +113,7 @@ class XYFitEnsemble(FitEnsembleBase):
         self._model_parameters = np.asarray(model_parameters)
         self._cost_function = cost_function
         self._n_par = len(self._model_parameters)
+        self._rng = np.random.default_rng(seed)
 
         # initialize an `XYFit` object for performing the toy fits
         # need some dummy initial data values in order to initialize a Fit object
@@ -149,34 +151,68 @@ class XYFitEnsemble(FitEnsembleBase):
         self._toy_fit._param_model._pm_calculation_stale = True
 
     def _generate_pseudodata(self):
-        """generate new pseudo-data according to fit error model and commit to data container"""
+        """generate the pseudo-data of all pseudo-experiments according to the fit error model"""
 
         if not self._toy_fit.has_errors:
             raise FitEnsembleException("Cannot generate fit ensemble: no error model specified!")
 
+        # TODO: only gaussian smearing is implemented -> more?
         # -- generate 'x' data
-        _x_data = self._ref_x_data.copy()
-
         if self._toy_fit.data_container.has_x_errors:
             # smear x data according to the total 'x' covariance matrix
-            # TODO: only gaussian smearing is implemented -> more?
-            _x_jitter = np.random.multivariate_normal(np.zeros_like(_x_data), self._ref_x_cov_mat)
-            _x_data += _x_jitter
-
-        _y_data = self._toy_fit.eval_model_function(x=_x_data, model_parameters=self._model_parameters)
+            self._pseudo_x_data = self._ref_x_data + self._gaussian_jitters(self._ref_x_cov_mat, self.n_exp)
+            self._pseudo_y_data = np.array(
+                [self._toy_fit.eval_model_function(x=_x_data, model_parameters=self._model_parameters) for _x_data in self._pseudo_x_data]
+            )
+        else:
+            # x data are not smeared, so the model values are the same for every experiment
+            self._pseudo_x_data = np.broadcast_to(self._ref_x_data, (self.n_exp, self.n_dat))
+            self._pseudo_y_data = np.tile(self._ref_y_data, (self.n_exp, 1))
 
         # smear y data according to the total 'y' covariance matrix
-        # TODO: only gaussian smearing is implemented -> more?
-        _y_jitter = np.random.multivariate_normal(np.zeros_like(_y_data), self._ref_y_cov_mat)
-        _y_data += _y_jitter
-
-        # update toy fit data container
-        self._toy_fit.data_container.x = _x_data
-        self._toy_fit.data_container.y = _y_data
+        self._pseudo_y_data += self._gaussian_jitters(self._ref_y_cov_mat, self.n_exp)
+
+    def _set_pseudodata(self, i_exp):
+        """commit the pseudo-data of the `i_exp`-th pseudo-experiment to the toy fit data container"""
+        self._toy_fit.data_container.x = self._pseudo_x_data[i_exp]
+        self._toy_fit.data_container.y = self._pseudo_y_data[i_exp]
+        # the container does not notify the fit, mark the nexus data nodes for update manually
+        self._toy_fit._nexus.get("x_data").mark_for_update()
+        self._toy_fit._nexus.get("y_data").mark_for_update()
+
+    def _gaussian_jitters(self, cov_mat, n_samples):
+        """draw Gaussian jitter vectors with the given covariance matrix, one per row"""
+        if np.count_nonzero(cov_mat) == np.count_nonzero(np.diagonal(cov_mat)):
+            # uncorrelated errors: no factorization needed, just scale by the standard deviations
+            return self._rng.standard_normal((n_samples, cov_mat.shape[0])) * np.sqrt(np.diagonal(cov_mat))
+        # the matrix is only factorized here, once per run, and not every time an error is added
+        try:
+            cov_mat_chol = scipy.linalg.cholesky(cov_mat, lower=True, check_finite=False)
+        except scipy.linalg.LinAlgError:
+            # matrix is not positive definite (e.g. fully correlated errors)
+            return self._rng.multivariate_normal(np.zeros(cov_mat.shape[0]), cov_mat, size=n_samples)
+        return self._rng.standard_normal((n_samples, cov_mat.shape[0])).dot(cov_mat_chol.T)
 
     def _gather_results_from_toy_fit(self, i_exp):
         for _var_name in self._requested_results:
-            self._ensemble_variables[_var_name].set_value(index=i_exp, variable_value=self._get_var(_var_name))
+            _ensemble_variable = self._ensemble_variables[_var_name]
+            # write pulls directly into the ensemble arrays instead of allocating them for every experiment
+            if _var_name == "y_pulls":
+                self._calculate_y_pulls(out=_ensemble_variable.values[i_exp])
+            elif _var_name == "parameter_pulls":
+                self._calculate_parameter_pulls(out=_ensemble_variable.values[i_exp])
+            else:
+                _ensemble_variable.set_value(index=i_exp, variable_value=self._get_var(_var_name))
+
+    def _calculate_parameter_pulls(self, out=None):
+        """calculate the parameter pulls of the current fit, optionally writing them into the array `out`"""
+        _pulls = np.subtract(self._toy_fit.parameter_values, self._model_parameters, out=out)
+        return np.divide(_pulls, self._toy_fit.parameter_errors, out=_pulls)
+
+    def _calculate_y_pulls(self, out=None):
+        """calculate the y pulls of the current fit, optionally writing them into the array `out`"""
+        _pulls = np.subtract(self._toy_fit.y_data, self._toy_fit.y_model, out=out)
+        return np.divide(_pulls, self._toy_fit.y_total_error, out=_pulls)
 
     def _do_toy_fit(self):
         """run fit with current pseudo-data"""
@@ -198,7 +234,7 @@ class XYFitEnsemble(FitEnsembleBase):
             self._ensemble_variable_plotters["y_pulls"] = EnsembleVariablePlotter(
                 ensemble_variable=self._ensemble_variables["y_pulls"],
                 value_ranges=(-3, 3),
-                variable_labels=["Pull $y_{%d}$" % (_i,) for _i in six.moves.range(1, self.n_dat + 1)],
+                variable_labels=["Pull $y_{%d}$" % (_i,) for _i in range(1, self.n_dat + 1)],
             )
 
         if "x_data" in self._requested_results:
@@ -215,7 +251,7 @@ class XYFitEnsemble(FitEnsembleBase):
                         self._ref_x_data + 3 * self._toy_fit.x_total_error,
                     ]
                 ).T,
-                variable_labels=["$x_{%d}$" % (_i,) for _i in six.moves.range(1, self.n_dat + 1)],
+                variable_labels=["$x_{%d}$" % (_i,) for _i in range(1, self.n_dat + 1)],
             )
 
         if "y_data" in self._requested_results:
@@ -232,7 +268,7 @@ class XYFitEnsemble(FitEnsembleBase):
                         self._ref_y_data + 3 * self._ref_projected_xy_err,
                     ]
                 ).T,
-                variable_labels=["$y_{%d}$" % (_i,) for _i in six.moves.range(1, self.n_dat + 1)],
+                variable_labels=["$y_{%d}$" % (_i,) for _i in range(1, self.n_dat + 1)],
             )
 
         if "y_model" in self._requested_results:
@@ -249,7 +285,7 @@ class XYFitEnsemble(FitEnsembleBase):
                         self._ref_y_data + 3 * self._ref_projected_xy_err,
                     ]
                 ).T,
-                variable_labels=["$f(x_{%d})$" % (_i,) for _i in six.moves.range(1, self.n_dat + 1)],
+                variable_labels=["$f(x_{%d})$" % (_i,) for _i in range(1, self.n_dat + 1)],
             )
 
         if "parameter_pulls" in self._requested_results:
@@ -313,7 +349,7 @@ class XYFitEnsemble(FitEnsembleBase):
     @property
     def _parameter_pulls(self):
         """property for ensemble variable 'parameter_pulls'"""
-        return (self._toy_fit.parameter_values - self._model_parameters) / self._toy_fit.parameter_errors
+        return self._calculate_parameter_pulls()
 
     @property
     def _y_data(self):
@@ -328,7 +364,7 @@ class XYFitEnsemble(FitEnsembleBase):
     @property
     def _y_pulls(self):
         """property for ensemble variable 'y_pulls'"""
-        return (self._toy_fit.y_data - self._toy_fit.y_model) / self._toy_fit.y_total_error
+        return self._calculate_y_pulls()
 
     @property
     def _cost(self):
@@ -416,8 +452,9 @@ class XYFitEnsemble(FitEnsembleBase):
         self._set_toy_fit_parameters_to_reference()
         self._update_reference_quantities_from_toy_fit()
         self._initialize_ensemble_variables()
-        for _i_exp in six.moves.range(self.n_exp):
-            self._generate_pseudodata()
+        self._generate_pseudodata()
+        for _i_exp in range(self.n_exp):
+            self._set_pseudodata(_i_exp)
             self._do_toy_fit()
             self._gather_results_from_toy_fit(_i_exp)
 
@@ -528,16 +565,10 @@ class XYFitEnsemble(FitEnsembleBase):
                 _nrows, _ncols = _heuristic_optimal_subplot_grid_size(_nplots, aspect_ratio_priority=0.8)
                 _fig, _gs = self._make_figure_gs(figsize=(8, 8), nrows=_nrows, ncols=_ncols)
 
-                # create an array 'a' with a[i, j] = [i, j]
-                _axes_grid = np.dstack((np.meshgrid(np.arange(_nrows), np.arange(_ncols))))
-                # replace [i, j] by the `Axes` object for _gs[i, j] -> array of `Axes`
-                _axes_grid = np.apply_along_axis(
-                    lambda irow_icol: plt.subplot(_gs[irow_icol[0], irow_icol[1]]) if irow_icol[0] * _ncols + irow_icol[1] < _nplots else None,
-                    -1,
-                    _axes_grid,
-                )
-                # reshape the `Axes` array to match the variable shape
-                _axes_grid = _axes_grid.T.flatten()[: _result_variable.shape[0]]
+                # fill the grid row by row with one `Axes` object per variable entry
+                _axes_grid = np.empty(_nplots, dtype=object)
+                for _i_plot in range(_nplots):
+                    _axes_grid[_i_plot] = _fig.add_subplot(_gs[_i_plot // _ncols, _i_plot % _ncols])
                 # call the plotting routine on the axes grid
                 _plot_result_dict = _result_variable_plotter.plot_hist(_axes_grid)
 
@@ -551,11 +582,12 @@ class XYFitEnsemble(FitEnsembleBase):
 
                 _fig, _gs = self._make_figure_gs(figsize=(8, 8), nrows=_nrows, ncols=_ncols)
 
-                # create an array 'a' with a[i, j] = [i, j]
-                _axes_grid = np.dstack(reversed(np.meshgrid(np.arange(_nrows), np.arange(_ncols))))
-                # replace [i, j] by the `Axes` object for _gs[i, j] -> array of `Axes`
-                _axes_grid = np.apply_along_axis(lambda irow_icol: plt.subplot(_gs[irow_icol[0], irow_icol[1]]), -1, _axes_grid)
-                # do not reshape _axes_grid -> its shape already matches variable shape
+                # create an array of `Axes` objects with a[i, j] in _gs[i, j]
+                # -> its shape already matches variable shape
+                _axes_grid = np.empty((_nrows, _ncols), dtype=object)
+                for _i_row in range(_nrows):
+                    for _i_col in range(_ncols):
+                        _axes_grid[_i_row, _i_col] = _fig.add_subplot(_gs[_i_row, _i_col])
 
                 # call the plotting routine on the axes grid
                 _plot_result_dict = _result_variable_plotter.plot_hist(_axes_grid)
@@ -577,7 +609,7 @@ class XYFitEnsemble(FitEnsembleBase):
                 # no extra space at figure bottom
                 _figure_extra_bottom = 0.0
 
-            _fig.canvas.set_window_title(_result_name)
+            _fig.canvas.manager.set_window_title(_result_name)
 
             _gs.tight_layout(
                 _fig,
@@ -655,7 +687,7 @@ class XYFitEnsemble(FitEnsembleBase):
                 # no extra space at figure bottom
                 _figure_extra_bottom = 0.0
 
-            _fig.canvas.set_window_title(_result_name)
+            _fig.canvas.manager.set_window_title(_result_name)
 
             _gs.tight_layout(
                 _fig,
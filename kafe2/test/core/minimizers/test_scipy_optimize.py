@@ -1,8 +1,35 @@
 import unittest
 
+import numpy as np
+
 from kafe2.core.minimizers.scipy_optimize_minimizer import MinimizerScipyOptimize
 from kafe2.test.core.minimizers._base import AbstractMinimizerTest
 
+_REF_PAR_VAL_CORRELATED = np.array([1.2, -0.7, 3.1])
+_REF_COV_MAT_CORRELATED = np.array([[0.25, 0.12, 0.05], [0.12, 0.36, -0.2], [0.05, -0.2, 0.64]])
+_REF_COV_MAT_INV_CORRELATED = np.linalg.inv(_REF_COV_MAT_CORRELATED)
+
+
+def fcn_3_correlated(a, b, c):
+    _residuals = np.array([a, b, c]) - _REF_PAR_VAL_CORRELATED
+    return _residuals @ _REF_COV_MAT_INV_CORRELATED @ _residuals + 2.0
+
+
+def grid_contour_crossings(contour):
+    """Linearly interpolate the points where the grid of a grid contour crosses its sigma value."""
+    _crossings = []
+    for _grid_z, _axis_values, _other_axis_values, _transposed in (
+        (contour.grid_z, contour.grid_x, contour.grid_y, False),
+        (contour.grid_z.T, contour.grid_y, contour.grid_x, True),
+    ):
+        _diff = _grid_z - contour.sigma
+        _i, _j = np.nonzero(np.sign(_diff[:-1]) != np.sign(_diff[1:]))
+        _t = _diff[_i, _j] / (_diff[_i, _j] - _diff[_i + 1, _j])
+        _crossing_values = _axis_values[_i] + _t * (_axis_values[_i + 1] - _axis_values[_i])
+        _points = [_crossing_values, _other_axis_values[_j]]
+        _crossings.append(np.stack(_points[::-1] if _transposed else _points, axis=-1))
+    return np.concatenate(_crossings)
+
 
 class TestMinimizerScipyOptimize(AbstractMinimizerTest, unittest.TestCase):
     def _get_minimizer(self, parameter_names, parameter_values, parameter_errors, function_to_minimize):
@@ -16,3 +43,54 @@ class TestMinimizerScipyOptimize(AbstractMinimizerTest, unittest.TestCase):
     @property
     def _expected_tolerance(self):
         return 1e-6
+
+    def _get_correlated_minimizer(self):
+        _minimizer = self._get_minimizer(
+            parameter_names=["a", "b", "c"],
+            parameter_values=(0.0, 0.0, 0.0),
+            parameter_errors=(0.1, 0.1, 0.1),
+            function_to_minimize=fcn_3_correlated,
+        )
+        _minimizer.minimize()
+        return _minimizer
+
+    def _assert_points_on_ellipse(self, points, center, cov_mat, sigma, tolerance):
+        # For a quadratic cost function the profile of two parameters is quadratic as well,
+        # the n sigma contour is the ellipse defined by the marginal covariance matrix:
+        self.assertGreater(len(points), 10)
+        _residuals = points - center
+        _n_sigma = np.sqrt(np.einsum("pi,ij,pj->p", _residuals, np.linalg.inv(cov_mat), _residuals))
+        self.assertTrue(np.allclose(_n_sigma, sigma, rtol=0, atol=tolerance))
+        # The points must go around the whole ellipse:
+        _angles = np.arctan2(_residuals[:, 1], _residuals[:, 0])
+        self.assertEqual(len(np.unique(np.digitize(_angles, np.linspace(-np.pi, np.pi, 9)))), 8)
+
+    def _assert_correlated_contours(self, algorithm, tolerance):
+        _minimizer = self._get_correlated_minimizer()
+        # "b" is a free parameter in between the contour parameters for ("a", "c") and ("c", "a"):
+        for _par_names in (("a", "b"), ("a", "c"), ("c", "a")):
+            _ids = [_minimizer.parameter_names.index(_name) for _name in _par_names]
+            for _sigma in (1.0, 2.0):
+                with self.subTest(parameters=_par_names, sigma=_sigma):
+                    _contour = _minimizer.contour(*_par_names, sigma=_sigma, algorithm=algorithm)
+                    _points = _contour.xy_points.T if algorithm == "beacon" else grid_contour_crossings(_contour)
+                    self._assert_points_on_ellipse(
+                        _points, _REF_PAR_VAL_CORRELATED[_ids], _REF_COV_MAT_CORRELATED[np.ix_(_ids, _ids)], _sigma, tolerance
+                    )
+                    self.assertTrue(np.allclose(_minimizer.parameter_values, _REF_PAR_VAL_CORRELATED, rtol=0, atol=1e-4))
+
+    def test_contour_beacon_m3_x_y(self):
+        self.m3.minimize()
+        _contour = self.m3.contour("x", "y", sigma=1.0, algorithm="beacon")
+        self._assert_points_on_ellipse(_contour.xy_points.T, self._ref_par_val_fcn3[:2], self._ref_cov_mat_fcn3[:2, :2], 1.0, 1e-2)
+
+    def test_contour_beacon_correlated(self):
+        self._assert_correlated_contours("beacon", 1e-2)
+
+    def test_contour_heuristic_grid_m3_x_y(self):
+        self.m3.minimize()
+        _contour = self.m3.contour("x", "y", sigma=1.0, algorithm="heuristic_grid")
+        self._assert_points_on_ellipse(grid_contour_crossings(_contour), self._ref_par_val_fcn3[:2], self._ref_cov_mat_fcn3[:2, :2], 1.0, 1e-3)
+
+    def test_contour_heuristic_grid_correlated(self):
+        self._assert_correlated_contours("heuristic_grid", 1e-3)
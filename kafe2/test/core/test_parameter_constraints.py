@@ -9,12 +9,14 @@ from kafe2.core.constraint import (
 
 
 class TestMatrixParameterConstraintDirect(unittest.TestCase):
-    def setUp(self):
-        self._fit_par_values = [0.1, 1.2, 2.3, 3.4, 4.5, 5.6, 6.7, 7.8, 8.9, 9.0]
-        self._par_test_values = np.array([[8.9, 3.4, 5.6], [0.1, 2.3, 9.0], [5.6, 4.5, 3.4]])
-        self._par_indices = [[8, 3, 5], [0, 2, 9], [5, 4, 3]]
-        self._par_values = np.array([[1.23, 7.20, 3.95], [4.11, 3.00, 2.95], [0.1, -8.5, 67.0]])
-        self._par_cov_mats_abs = np.array(
+    @classmethod
+    def setUpClass(cls):
+        # the fixtures are constant, build them and the expected costs only once for all tests
+        cls._fit_par_values = [0.1, 1.2, 2.3, 3.4, 4.5, 5.6, 6.7, 7.8, 8.9, 9.0]
+        cls._par_test_values = np.array([[8.9, 3.4, 5.6], [0.1, 2.3, 9.0], [5.6, 4.5, 3.4]])
+        cls._par_indices = [[8, 3, 5], [0, 2, 9], [5, 4, 3]]
+        cls._par_values = np.array([[1.23, 7.20, 3.95], [4.11, 3.00, 2.95], [0.1, -8.5, 67.0]])
+        cls._par_cov_mats_abs = np.array(
             [
                 [
                     [1.0, 0.0, 0.0],
@@ -28,7 +30,7 @@ class TestMatrixParameterConstraintDirect(unittest.TestCase):
                 ],
             ]
         )
-        self._par_cov_mats_rel = np.array(
+        cls._par_cov_mats_rel = np.array(
             [
                 [
                     [0.1, 0.0, 0.0],
@@ -42,45 +44,50 @@ class TestMatrixParameterConstraintDirect(unittest.TestCase):
                 ],
             ]
         )
-        self._uncertainties_abs = np.array([[1.2, 2.3, 0.4], [6.5, 2.6, 1.0]])
-        self._uncertainties_rel = np.array([[0.2, 0.3, 0.2], [0.5, 2.6, 1.0]])
-        self._par_cor_mats = np.array(
+        cls._uncertainties_abs = np.array([[1.2, 2.3, 0.4], [6.5, 2.6, 1.0]])
+        cls._uncertainties_rel = np.array([[0.2, 0.3, 0.2], [0.5, 2.6, 1.0]])
+        cls._par_cor_mats = np.array(
             [
                 [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
                 [[1.0, 0.1, 0.2], [0.1, 1.0, 0.3], [0.2, 0.3, 1.0]],
             ]
         )
 
-        self._expected_cost_cov_abs = np.zeros((3, 3, 2))
+        cls._expected_cost_cov_abs = np.zeros((3, 3, 2))
         for _i in range(3):
             for _j in range(3):
                 for _k in range(2):
-                    _res = self._par_test_values[_i] - self._par_values[_j]
-                    self._expected_cost_cov_abs[_i, _j, _k] = _res.dot(np.linalg.inv(self._par_cov_mats_abs[_k])).dot(_res)
-        self._expected_cost_cov_rel = np.zeros((3, 3, 2))
+                    _res = cls._par_test_values[_i] - cls._par_values[_j]
+                    cls._expected_cost_cov_abs[_i, _j, _k] = _res.dot(np.linalg.inv(cls._par_cov_mats_abs[_k])).dot(_res)
+        cls._expected_cost_cov_rel = np.zeros((3, 3, 2))
         for _i in range(3):
             for _j in range(3):
                 for _k in range(2):
-                    _res = self._par_test_values[_i] - self._par_values[_j]
-                    _abs_cov_mat = self._par_cov_mats_rel[_k] * np.outer(self._par_values[_j], self._par_values[_j])
-                    self._expected_cost_cov_rel[_i, _j, _k] = _res.dot(np.linalg.inv(_abs_cov_mat)).dot(_res)
-        self._expected_cost_cor_abs = np.zeros((3, 3, 2, 2))
+                    _res = cls._par_test_values[_i] - cls._par_values[_j]
+                    _abs_cov_mat = cls._par_cov_mats_rel[_k] * np.outer(cls._par_values[_j], cls._par_values[_j])
+                    cls._expected_cost_cov_rel[_i, _j, _k] = _res.dot(np.linalg.inv(_abs_cov_mat)).dot(_res)
+        cls._expected_cost_cor_abs = np.zeros((3, 3, 2, 2))
         for _i in range(3):
             for _j in range(3):
                 for _k in range(2):
                     for _l in range(2):
-                        _res = self._par_test_values[_i] - self._par_values[_j]
-                        _cov_mat = self._par_cor_mats[_k] * np.outer(self._uncertainties_abs[_l], self._uncertainties_abs[_l])
-                        self._expected_cost_cor_abs[_i, _j, _k, _l] = _res.dot(np.linalg.inv(_cov_mat)).dot(_res)
-        self._expected_cost_cor_rel = np.zeros((3, 3, 2, 2))
+                        _res = cls._par_test_values[_i] - cls._par_values[_j]
+                        _cov_mat = cls._par_cor_mats[_k] * np.outer(cls._uncertainties_abs[_l], cls._uncertainties_abs[_l])
+                        cls._expected_cost_cor_abs[_i, _j, _k, _l] = _res.dot(np.linalg.inv(_cov_mat)).dot(_res)
+        cls._expected_cost_cor_rel = np.zeros((3, 3, 2, 2))
         for _i in range(3):
             for _j in range(3):
                 for _k in range(2):
                     for _l in range(2):
-                        _res = self._par_test_values[_i] - self._par_values[_j]
-                        _uncertainties_abs = self._uncertainties_rel[_l] * self._par_values[_j]
-                        _cov_mat = self._par_cor_mats[_k] * np.outer(_uncertainties_abs, _uncertainties_abs)
-                        self._expected_cost_cor_rel[_i, _j, _k, _l] = _res.dot(np.linalg.inv(_cov_mat)).dot(_res)
+                        _res = cls._par_test_values[_i] - cls._par_values[_j]
+                        _uncertainties_abs = cls._uncertainties_rel[_l] * cls._par_values[_j]
+                        _cov_mat = cls._par_cor_mats[_k] * np.outer(_uncertainties_abs, _uncertainties_abs)
+                        cls._expected_cost_cor_rel[_i, _j, _k, _l] = _res.dot(np.linalg.inv(_cov_mat)).dot(_res)
+
+        # write-protect the shared arrays so that tests cannot modify them by accident
+        for _value in vars(cls).values():
+            if isinstance(_value, np.ndarray):
+                _value.setflags(write=False)
 
     def _call_all_properties(self, matrix_constraint):
         matrix_constraint.indices
@@ -205,98 +212,53 @@ class TestSimpleParameterConstraintDirect(unittest.TestCase):
         self._par_values = [1.23, 7.20, 3.95]
         self._par_uncertainties_abs = [1.0, 2.8, 0.001]
         self._par_uncertainties_rel = [0.1, 0.3, 0.01]
-        self._expected_cost_abs = np.zeros((3, 3, 3))
-        for _i in range(3):
-            for _j in range(3):
-                for _k in range(3):
-                    _res = self._par_test_values[_i] - self._par_values[_j]
-                    self._expected_cost_abs[_i, _j, _k] = (_res / self._par_uncertainties_abs[_k]) ** 2
-        self._expected_cost_rel = np.zeros((3, 3, 3))
-        for _i in range(3):
-            for _j in range(3):
-                for _k in range(3):
-                    _res = self._par_test_values[_i] - self._par_values[_j]
-                    self._expected_cost_rel[_i, _j, _k] = (_res / (self._par_uncertainties_rel[_k] * self._par_values[_j])) ** 2
+        # index order of the expected costs: [test value, constraint value, uncertainty]
+        _res = np.asarray(self._par_test_values)[:, np.newaxis, np.newaxis] - np.asarray(self._par_values)[np.newaxis, :, np.newaxis]
+        self._expected_cost_abs = (_res / np.asarray(self._par_uncertainties_abs)[np.newaxis, np.newaxis, :]) ** 2
+        _par_uncertainties_rel_abs = np.outer(self._par_values, self._par_uncertainties_rel)[np.newaxis, :, :]
+        self._expected_cost_rel = (_res / _par_uncertainties_rel_abs) ** 2
 
-    def test_cost_simple_abs(self):
-        for _i in range(3):
-            for _j in range(3):
-                for _k in range(3):
-                    _constraint = GaussianSimpleParameterConstraint(self._par_indices[_i], self._par_values[_j], self._par_uncertainties_abs[_k])
-                    self.assertTrue(
-                        np.allclose(
-                            _constraint.cost(self._fit_par_values),
-                            self._expected_cost_abs[_i, _j, _k],
-                        )
-                    )
-
-                    # ensure that results are consistent with matrix constraints
-                    _constraint = GaussianMatrixParameterConstraint(
-                        [self._par_indices[_i]],
-                        [self._par_values[_j]],
-                        [[self._par_uncertainties_abs[_k] ** 2]],
-                    )
-                    self.assertTrue(
-                        np.allclose(
-                            _constraint.cost(self._fit_par_values),
-                            self._expected_cost_abs[_i, _j, _k],
-                        )
-                    )
-                    _constraint = GaussianMatrixParameterConstraint(
-                        [self._par_indices[_i]],
-                        [self._par_values[_j]],
-                        [[1.0]],
-                        matrix_type="cor",
-                        uncertainties=[self._par_uncertainties_abs[_k]],
-                    )
-                    self.assertTrue(
-                        np.allclose(
-                            _constraint.cost(self._fit_par_values),
-                            self._expected_cost_abs[_i, _j, _k],
-                        )
-                    )
-
-    def test_cost_simple_rel(self):
+    def _assert_costs_consistent(self, relative):
+        _par_uncertainties = self._par_uncertainties_rel if relative else self._par_uncertainties_abs
+        _expected_cost = self._expected_cost_rel if relative else self._expected_cost_abs
+        _cost_simple = np.zeros((3, 3, 3))
+        _cost_matrix_cov = np.zeros((3, 3, 3))
+        _cost_matrix_cor = np.zeros((3, 3, 3))
         for _i in range(3):
             for _j in range(3):
                 for _k in range(3):
                     _constraint = GaussianSimpleParameterConstraint(
                         self._par_indices[_i],
                         self._par_values[_j],
-                        self._par_uncertainties_rel[_k],
-                        relative=True,
-                    )
-                    self.assertTrue(
-                        np.allclose(
-                            _constraint.cost(self._fit_par_values),
-                            self._expected_cost_rel[_i, _j, _k],
-                        )
+                        _par_uncertainties[_k],
+                        relative=relative,
                     )
+                    _cost_simple[_i, _j, _k] = _constraint.cost(self._fit_par_values)
 
                     # ensure that results are consistent with matrix constraints
                     _constraint = GaussianMatrixParameterConstraint(
                         [self._par_indices[_i]],
                         [self._par_values[_j]],
-                        [[self._par_uncertainties_rel[_k] ** 2]],
-                        relative=True,
-                    )
-                    self.assertTrue(
-                        np.allclose(
-                            _constraint.cost(self._fit_par_values),
-                            self._expected_cost_rel[_i, _j, _k],
-                        )
+                        [[_par_uncertainties[_k] ** 2]],
+                        relative=relative,
                     )
+                    _cost_matrix_cov[_i, _j, _k] = _constraint.cost(self._fit_par_values)
                     _constraint = GaussianMatrixParameterConstraint(
                         [self._par_indices[_i]],
                         [self._par_values[_j]],
                         [[1.0]],
                         matrix_type="cor",
-                        uncertainties=[self._par_uncertainties_rel[_k]],
-                        relative=True,
-                    )
-                    self.assertTrue(
-                        np.allclose(
-                            _constraint.cost(self._fit_par_values),
-                            self._expected_cost_rel[_i, _j, _k],
-                        )
+                        uncertainties=[_par_uncertainties[_k]],
+                        relative=relative,
                     )
+                    _cost_matrix_cor[_i, _j, _k] = _constraint.cost(self._fit_par_values)
+
+        self.assertTrue(np.allclose(_cost_simple, _expected_cost))
+        self.assertTrue(np.allclose(_cost_matrix_cov, _expected_cost))
+        self.assertTrue(np.allclose(_cost_matrix_cor, _expected_cost))
+
+    def test_cost_simple_abs(self):
+        self._assert_costs_consistent(relative=False)
+
+    def test_cost_simple_rel(self):
+        self._assert_costs_consistent(relative=True)
@@ -200,6 +200,18 @@ class TestCostBuiltin(unittest.TestCase):
             ),
         )
 
+    def test_nllr_poisson_invalid_model(self):
+        _nllr_poisson = self.NLL_COST_FUNCTION(data_point_distribution="poisson", ratio=True)
+        _model_zero = np.array([0.0, 8.4, 2.3])
+        self.assertAlmostEqual(
+            self._cost_nllr_poisson - 2.0 * self._model_poisson[0],
+            _nllr_poisson(self._data_poisson, _model_zero, None, None),
+        )
+        _model_zero[1] = 0.0
+        self.assertEqual(np.inf, _nllr_poisson(self._data_poisson, _model_zero, None, None))
+        _model_zero[1] = -1.0
+        self.assertEqual(np.inf, _nllr_poisson(self._data_poisson, _model_zero, None, None))
+
     def test_gauss_approximation(self):
         self.assertAlmostEqual(
             self.NLL_COST_FUNCTION(data_point_distribution="poisson")(self._data_poisson_large, self._model_poisson_large, None, None),
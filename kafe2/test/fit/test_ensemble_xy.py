@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from kafe2.fit.xy.ensemble import XYFitEnsemble
+
+
+def line_xy_model(x, a=1.0, b=1.0):
+    return a * x + b
+
+
+class TestXYFitEnsemble(unittest.TestCase):
+    def setUp(self):
+        self._ref_n_exp = 200
+        self._ref_x_support = np.linspace(0, 10, 20)
+        self._ref_model_parameters = np.array([1.5, 0.3])
+
+        self._ensemble = XYFitEnsemble(
+            n_experiments=self._ref_n_exp,
+            x_support=self._ref_x_support,
+            model_function=line_xy_model,
+            model_parameters=self._ref_model_parameters,
+            requested_results=("parameter_pulls", "y_data"),
+            seed=123456,
+        )
+        self._ensemble.add_error("y", 0.3)
+        self._ensemble.add_error("y", 0.1, correlation=0.5)
+
+    def _assert_pulls_standard_normal(self):
+        _statistics = self._ensemble.get_results_statistics(results=["parameter_pulls"], statistics=["mean", "std"])["parameter_pulls"]
+        # 5 sigma bounds for the sample mean and the sample standard deviation
+        self.assertTrue(np.all(np.abs(_statistics["mean"]) < 5 / np.sqrt(self._ref_n_exp)))
+        self.assertTrue(np.all(np.abs(_statistics["std"] - 1) < 5 / np.sqrt(2 * self._ref_n_exp)))
+
+    def test_pseudodata_differ_between_experiments(self):
+        self._ensemble.run()
+        _y_data = self._ensemble.get_results("y_data")["y_data"]
+        self.assertEqual(len(np.unique(_y_data[:, 0])), self._ref_n_exp)
+
+    def test_parameter_pulls_y_errors(self):
+        self._ensemble.run()
+        self._assert_pulls_standard_normal()
+
+    def test_seed_reproducible(self):
+        self._ensemble.run()
+        _y_data = self._ensemble.get_results("y_data")["y_data"]
+        self.setUp()
+        self._ensemble.run()
+        self.assertTrue(np.all(self._ensemble.get_results("y_data")["y_data"] == _y_data))
+
+    def test_parameter_pulls_xy_errors(self):
+        self._ensemble.add_error("x", 0.1)
+        self._ensemble.run()
+        self._assert_pulls_standard_normal()
@@ -22,19 +22,17 @@ class TestParameterConstraintInHistFit(unittest.TestCase):
         return 0.5 * a * x**2 + b * x
 
     def _expected_profile_diff(self, res, cov_mat_inv):
-        return res.dot(cov_mat_inv).dot(res)
+        # quadratic forms of all residual vectors along the last axis at once
+        return np.einsum("...i,ij,...j->...", res, cov_mat_inv, res)
 
     def _test_consistency(self, constrained_fit, par_cov_mat_inv):
         constrained_fit.do_fit()
         _cost_function = constrained_fit._fitter._fcn_wrapper
-        for _i in range(4):
-            for _j in range(9):
-                _a = self._test_par_values[_i, 0, _j]
-                _b = self._test_par_values[_i, 1, _j]
-                _profile_constrained = _cost_function(self._test_par_values[_i, 0, _j], self._test_par_values[_i, 1, _j])
-                _diff = _profile_constrained - self._profile_no_constraints[_i, _j]
-                _expected_profile_diff = self._expected_profile_diff(self._test_par_res[_i, _j], par_cov_mat_inv)
-                self.assertTrue(np.abs(_diff - _expected_profile_diff) < 1e-12)
+        # the fit's function wrapper only accepts scalar parameter values, map it over the test points
+        _profile_constrained = np.frompyfunc(_cost_function, 2, 1)(self._test_par_values[..., 0], self._test_par_values[..., 1]).astype(float)
+        _diff = _profile_constrained - self._profile_no_constraints
+        _expected_profile_diff = self._expected_profile_diff(self._test_par_res, par_cov_mat_inv)
+        self.assertTrue(np.all(np.abs(_diff - _expected_profile_diff) < 1e-12))
 
     def setUp(self):
         _bin_edges = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
@@ -61,15 +59,14 @@ class TestParameterConstraintInHistFit(unittest.TestCase):
 
         _a_test = np.linspace(start=1, stop=2, num=9, endpoint=True)
         _b_test = np.linspace(start=2, stop=3, num=9, endpoint=True)
-        self._test_par_values = np.zeros((4, 2, 9))
-        self._test_par_values[0, 0] = _a_test
-        self._test_par_values[1, 1] = _b_test
-        self._test_par_values[2, 0] = _a_test
-        self._test_par_values[2, 1] = _b_test
-        self._test_par_values[3, 0] = _a_test
-        self._test_par_values[3, 1] = _b_test[::-1]  # reverse order
-        self._test_par_res = self._test_par_values - self._means.reshape((1, 2, 1))
-        self._test_par_res = np.transpose(self._test_par_res, axes=(0, 2, 1))
+        self._test_par_values = np.zeros((4, 9, 2))
+        self._test_par_values[0, :, 0] = _a_test
+        self._test_par_values[1, :, 1] = _b_test
+        self._test_par_values[2, :, 0] = _a_test
+        self._test_par_values[2, :, 1] = _b_test
+        self._test_par_values[3, :, 0] = _a_test
+        self._test_par_values[3, :, 1] = _b_test[::-1]  # reverse order
+        self._test_par_res = self._test_par_values - self._means
 
         self._fit_no_constraints = HistFit(
             self._data_container,
@@ -78,10 +75,7 @@ class TestParameterConstraintInHistFit(unittest.TestCase):
         )
         self._fit_no_constraints.do_fit()
         _cost_function = self._fit_no_constraints._fitter._fcn_wrapper
-        self._profile_no_constraints = np.zeros((4, 9))
-        for _i in range(4):
-            for _j in range(9):
-                self._profile_no_constraints[_i, _j] = _cost_function(self._test_par_values[_i, 0, _j], self._test_par_values[_i, 1, _j])
+        self._profile_no_constraints = np.frompyfunc(_cost_function, 2, 1)(self._test_par_values[..., 0], self._test_par_values[..., 1]).astype(float)
 
     def test_bad_input_exception(self):
         _fit_with_constraint = HistFit(
@@ -143,17 +137,17 @@ class TestParameterConstraintInHistFit(unittest.TestCase):
 
 class TestParameterConstraintInIndexedFit(unittest.TestCase):
     def _expected_profile_diff(self, res, cov_mat_inv):
-        return res.dot(cov_mat_inv).dot(res)
+        # quadratic forms of all residual vectors along the last axis at once
+        return np.einsum("...i,ij,...j->...", res, cov_mat_inv, res)
 
     def _test_consistency(self, constrained_fit, par_cov_mat_inv):
         constrained_fit.do_fit()
         _cost_function = constrained_fit._fitter._fcn_wrapper
-        for _i in range(4):
-            for _j in range(9):
-                _profile_constrained = _cost_function(self._test_par_values[_i, 0, _j], self._test_par_values[_i, 1, _j])
-                _diff = _profile_constrained - self._profile_no_constraints[_i, _j]
-                _expected_profile_diff = self._expected_profile_diff(self._test_par_res[_i, _j], par_cov_mat_inv)
-                self.assertTrue(np.abs(_diff - _expected_profile_diff) < 1e-12)
+        # the fit's function wrapper only accepts scalar parameter values, map it over the test points
+        _profile_constrained = np.frompyfunc(_cost_function, 2, 1)(self._test_par_values[..., 0], self._test_par_values[..., 1]).astype(float)
+        _diff = _profile_constrained - self._profile_no_constraints
+        _expected_profile_diff = self._expected_profile_diff(self._test_par_res, par_cov_mat_inv)
+        self.assertTrue(np.all(np.abs(_diff - _expected_profile_diff) < 1e-12))
 
     @staticmethod
     def _model(a, b):
@@ -175,23 +169,19 @@ class TestParameterConstraintInIndexedFit(unittest.TestCase):
 
         _a_test = np.linspace(start=0, stop=4, num=9, endpoint=True)
         _b_test = np.linspace(start=-4, stop=0, num=9, endpoint=True)
-        self._test_par_values = np.zeros((4, 2, 9))
-        self._test_par_values[0, 0] = _a_test
-        self._test_par_values[1, 1] = _b_test
-        self._test_par_values[2, 0] = _a_test
-        self._test_par_values[2, 1] = _b_test
-        self._test_par_values[3, 0] = _a_test
-        self._test_par_values[3, 1] = -_b_test
-        self._test_par_res = self._test_par_values - self._means.reshape((1, 2, 1))
-        self._test_par_res = np.transpose(self._test_par_res, axes=(0, 2, 1))
+        self._test_par_values = np.zeros((4, 9, 2))
+        self._test_par_values[0, :, 0] = _a_test
+        self._test_par_values[1, :, 1] = _b_test
+        self._test_par_values[2, :, 0] = _a_test
+        self._test_par_values[2, :, 1] = _b_test
+        self._test_par_values[3, :, 0] = _a_test
+        self._test_par_values[3, :, 1] = -_b_test
+        self._test_par_res = self._test_par_values - self._means
 
         self._fit_no_constraints = IndexedFit(self._data_container, model_function=self._model)
         self._fit_no_constraints.do_fit()
         _cost_function = self._fit_no_constraints._fitter._fcn_wrapper
-        self._profile_no_constraints = np.zeros((4, 9))
-        for _i in range(4):
-            for _j in range(9):
-                self._profile_no_constraints[_i, _j] = _cost_function(self._test_par_values[_i, 0, _j], self._test_par_values[_i, 1, _j])
+        self._profile_no_constraints = np.frompyfunc(_cost_function, 2, 1)(self._test_par_values[..., 0], self._test_par_values[..., 1]).astype(float)
 
     def test_bad_input_exception(self):
         _fit_with_constraint = IndexedFit(self._data_container, model_function=self._model)
@@ -229,52 +219,50 @@ class TestParameterConstraintInIndexedFit(unittest.TestCase):
 
 class TestParameterConstraintInXYFit(unittest.TestCase):
     def _expected_profile_diff(self, res, cov_mat_inv):
-        return res.dot(cov_mat_inv).dot(res)
+        # quadratic forms of all residual vectors along the last axis at once
+        return np.einsum("...i,ij,...j->...", res, cov_mat_inv, res)
 
     def _test_consistency(self, constrained_fit, par_cov_mat_inv):
         constrained_fit.do_fit()
         _cost_function = constrained_fit._fitter._fcn_wrapper
-        for _i in range(4):
-            for _j in range(9):
-                _profile_constrained = _cost_function(self._test_par_values[_i, 0, _j], self._test_par_values[_i, 1, _j])
-                _diff = _profile_constrained - self._profile_no_constraints[_i, _j]
-                _expected_profile_diff = self._expected_profile_diff(self._test_par_res[_i, _j], par_cov_mat_inv)
-                self.assertTrue(np.abs(_diff - _expected_profile_diff) < 1e-12)
-
-    def setUp(self):
+        # the fit's function wrapper only accepts scalar parameter values, map it over the test points
+        _profile_constrained = np.frompyfunc(_cost_function, 2, 1)(self._test_par_values[..., 0], self._test_par_values[..., 1]).astype(float)
+        _diff = _profile_constrained - self._profile_no_constraints
+        _expected_profile_diff = self._expected_profile_diff(self._test_par_res, par_cov_mat_inv)
+        self.assertTrue(np.all(np.abs(_diff - _expected_profile_diff) < 1e-12))
+
+    @classmethod
+    def setUpClass(cls):
+        # reference quantities and the unconstrained profile are shared by all tests, compute them only once
         _x = [0.0, 1.0, 2.0, 3.0, 4.0]
         _y = [-2.1, 0.2, 1.9, 3.8, 6.1]
-        self._means = np.array([3.654, 7.789])
-        self._vars = np.array([2.467, 1.543])
-        self._cov_mat_uncor = np.array([[self._vars[0], 0.0], [0.0, self._vars[1]]])
-        self._cov_mat_uncor_inv = np.linalg.inv(self._cov_mat_uncor)
-        self._cov_mat_cor = np.array([[self._vars[0], 0.1], [0.1, self._vars[1]]])
-        self._cov_mat_cor_inv = np.linalg.inv(self._cov_mat_cor)
-        self._cov_mat_simple_a_inv = np.array([[1.0 / self._vars[0], 0.0], [0.0, 0.0]])
-        self._cov_mat_simple_b_inv = np.array([[0.0, 0.0], [0.0, 1.0 / self._vars[1]]])
-
-        self._data_container = XYContainer(x_data=_x, y_data=_y)
-        self._data_container.add_error(axis="y", err_val=1.0)
+        cls._means = np.array([3.654, 7.789])
+        cls._vars = np.array([2.467, 1.543])
+        cls._cov_mat_uncor = np.array([[cls._vars[0], 0.0], [0.0, cls._vars[1]]])
+        cls._cov_mat_uncor_inv = np.linalg.inv(cls._cov_mat_uncor)
+        cls._cov_mat_cor = np.array([[cls._vars[0], 0.1], [0.1, cls._vars[1]]])
+        cls._cov_mat_cor_inv = np.linalg.inv(cls._cov_mat_cor)
+        cls._cov_mat_simple_a_inv = np.array([[1.0 / cls._vars[0], 0.0], [0.0, 0.0]])
+        cls._cov_mat_simple_b_inv = np.array([[0.0, 0.0], [0.0, 1.0 / cls._vars[1]]])
+
+        cls._data_container = XYContainer(x_data=_x, y_data=_y)
+        cls._data_container.add_error(axis="y", err_val=1.0)
 
         _a_test = np.linspace(start=0, stop=4, num=9, endpoint=True)
         _b_test = np.linspace(start=-4, stop=0, num=9, endpoint=True)
-        self._test_par_values = np.zeros((4, 2, 9))
-        self._test_par_values[0, 0] = _a_test
-        self._test_par_values[1, 1] = _b_test
-        self._test_par_values[2, 0] = _a_test
-        self._test_par_values[2, 1] = _b_test
-        self._test_par_values[3, 0] = _a_test
-        self._test_par_values[3, 1] = -_b_test
-        self._test_par_res = self._test_par_values - self._means.reshape((1, 2, 1))
-        self._test_par_res = np.transpose(self._test_par_res, axes=(0, 2, 1))
-
-        self._fit_no_constraints = XYFit(self._data_container)
-        self._fit_no_constraints.do_fit()
-        _cost_function = self._fit_no_constraints._fitter._fcn_wrapper
-        self._profile_no_constraints = np.zeros((4, 9))
-        for _i in range(4):
-            for _j in range(9):
-                self._profile_no_constraints[_i, _j] = _cost_function(self._test_par_values[_i, 0, _j], self._test_par_values[_i, 1, _j])
+        cls._test_par_values = np.zeros((4, 9, 2))
+        cls._test_par_values[0, :, 0] = _a_test
+        cls._test_par_values[1, :, 1] = _b_test
+        cls._test_par_values[2, :, 0] = _a_test
+        cls._test_par_values[2, :, 1] = _b_test
+        cls._test_par_values[3, :, 0] = _a_test
+        cls._test_par_values[3, :, 1] = -_b_test
+        cls._test_par_res = cls._test_par_values - cls._means
+
+        cls._fit_no_constraints = XYFit(cls._data_container)
+        cls._fit_no_constraints.do_fit()
+        _cost_function = cls._fit_no_constraints._fitter._fcn_wrapper
+        cls._profile_no_constraints = np.frompyfunc(_cost_function, 2, 1)(cls._test_par_values[..., 0], cls._test_par_values[..., 1]).astype(float)
 
     def test_bad_input_exception(self):
         _fit_with_constraint = XYFit(self._data_container)
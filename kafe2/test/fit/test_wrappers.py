@@ -7,6 +7,7 @@ import unittest
 import numpy as np
 
 from kafe2 import XYFit, function_library, xy_fit
+from kafe2.fit.util.wrapper import _FIT_HISTORY_MAX_LENGTH, _fit_history, _get_fit_history_entries, clear_fit_history
 
 
 class TestWrapperCallableXY(unittest.TestCase):
@@ -165,3 +166,19 @@ class TestWrapperCallableXY(unittest.TestCase):
         self.assertEqual(len(os.listdir("results")), 2)
         self._assert_wrapper_equal()
         self.assertEqual(len(os.listdir("results")), 4)
+
+    def test_fit_history(self):
+        clear_fit_history()
+        _n_fits = _FIT_HISTORY_MAX_LENGTH + 2
+        _fits = [xy_fit(None, self._x_data, self._y_data, y_error=self._y_error, profile=False, save=False)["fit"] for _ in range(_n_fits)]
+        self.assertEqual(len(_fit_history), _FIT_HISTORY_MAX_LENGTH)
+        self.assertIs(_get_fit_history_entries(_n_fits - 1)[0]["fit"], _fits[-1])
+        self.assertIs(_get_fit_history_entries(2)[0]["fit"], _fits[2])
+        self.assertEqual([_f["fit"] for _f in _get_fit_history_entries(-3)], _fits[-3:])
+        self.assertEqual([_f["fit"] for _f in _get_fit_history_entries(-_n_fits)], _fits[2:])
+        # the two oldest fits have been evicted from the bounded history
+        for _evicted_index in (0, 1):
+            with self.assertRaises(IndexError):
+                _get_fit_history_entries(_evicted_index)
+        clear_fit_history()
+        self.assertEqual(len(_fit_history), 0)